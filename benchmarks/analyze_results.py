@@ -2,84 +2,100 @@
 Analyze and visualize benchmark results
 """
 
+import argparse
+import functools
 import json
+import matplotlib
+matplotlib.use('Agg')  # Headless backend: plots are only ever saved to files
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from pathlib import Path
 
+# Prefer orjson for parsing large result files; fall back to the stdlib
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# DataFrame.to_markdown needs the optional tabulate package
+try:
+    import tabulate  # noqa: F401
+    TABULATE_AVAILABLE = True
+except ImportError:
+    TABULATE_AVAILABLE = False
+
 
 def load_results(filename='benchmark_results.json'):
     """Load benchmark results from JSON"""
-    with open(filename, 'r') as f:
-        data = json.load(f)
-    return data
+    return _loads(Path(filename).read_bytes())
 
 
 def create_summary_table(data):
     """Create summary table from results"""
-    results = []
+    # Flatten nested 'cython'/'ctypes' stats in one vectorized pass; missing
+    # sub-dicts (e.g. memory-only benchmarks) come out as NaN
+    df = pd.json_normalize(data['results'], sep='_')
+    # Medians and IQRs, to match the speedup, which is a ratio of medians
+    df = df.reindex(columns=['name', 'category',
+                             'cython_median', 'cython_iqr',
+                             'ctypes_median', 'ctypes_iqr',
+                             'speedup'])
+    
+    timing_columns = ['cython_median', 'cython_iqr', 'ctypes_median', 'ctypes_iqr']
+    df[timing_columns] = df[timing_columns].astype(float) * 1000
+    df = df.rename(columns={c: f'{c}_ms' for c in timing_columns})
+    
+    # float32 is plenty for the 2-4 decimals we report and halves column memory
+    numeric_columns = [f'{c}_ms' for c in timing_columns] + ['speedup']
+    df[numeric_columns] = df[numeric_columns].astype(np.float32)
+    
+    # Categorical codes make groupby/unique work on ints instead of strings
+    df['category'] = df['category'].astype('category')
     
-    for result in data['results']:
-        row = {
-            'name': result['name'],
-            'category': result['category']
-        }
-        
-        if result.get('cython'):
-            row['cython_mean_ms'] = result['cython']['mean'] * 1000
-            row['cython_std_ms'] = result['cython']['std'] * 1000
-        else:
-            row['cython_mean_ms'] = None
-            row['cython_std_ms'] = None
-            
-        if result.get('ctypes'):
-            row['ctypes_mean_ms'] = result['ctypes']['mean'] * 1000
-            row['ctypes_std_ms'] = result['ctypes']['std'] * 1000
-        else:
-            row['ctypes_mean_ms'] = None
-            row['ctypes_std_ms'] = None
-            
-        if result.get('speedup'):
-            row['speedup'] = result['speedup']
-        else:
-            row['speedup'] = None
-            
-        results.append(row)
-    
-    df = pd.DataFrame(results)
     return df
 
 
-def plot_speedup_by_category(df, output_file='speedup_by_category.png'):
-    """Plot speedup grouped by category"""
-    fig, ax = plt.subplots(figsize=(14, 8))
+# Shared style for the per-benchmark x-tick labels
+BENCHMARK_TICK_STYLE = {'rotation': 90, 'ha': 'right'}
+
+
+@functools.lru_cache(maxsize=32)
+def _palette(n):
+    """Set3 colors for n categories (cached; treat the result as read-only)"""
+    return plt.cm.Set3(np.linspace(0, 1, n))
+
+
+def _bar_positions(groups):
+    """Bar x-positions per category, leaving a one-bar gap between categories"""
+    sizes = np.array([len(category_data) for _, category_data in groups], dtype=int)
+    offsets = np.concatenate(([0], np.cumsum(sizes + 1)[:-1]))
+    return [np.arange(offset, offset + size) for offset, size in zip(offsets, sizes)]
+
+
+def plot_speedup_by_category(groups, colors, names, output_file='speedup_by_category.png',
+                             rasterize=True, max_bars=200):
+    """Plot speedup grouped by category (per-category summary above max_bars bars)"""
+    if len(names) > max_bars:
+        agg_file = output_file.replace('.png', '_agg.png')
+        print(f"{len(names)} benchmarks exceed max_bars={max_bars}; "
+              f"plotting per-category summary to {agg_file} instead")
+        return plot_category_summary(groups, output_file=agg_file, rasterize=rasterize)
     
-    categories = df['category'].unique()
-    colors = plt.cm.Set3(np.linspace(0, 1, len(categories)))
+    fig, ax = plt.subplots(figsize=(14, 8))
     
-    category_positions = {}
-    current_pos = 0
+    all_positions = _bar_positions(groups)
     
-    for i, category in enumerate(categories):
-        category_data = df[df['category'] == category]
-        positions = np.arange(current_pos, current_pos + len(category_data))
-        category_positions[category] = (positions[0], positions[-1])
-        
-        speedups = category_data['speedup'].values
-        names = category_data['name'].values
+    for (category, category_data), positions in zip(groups, all_positions):
+        speedups = category_data['speedup'].to_numpy()
         
-        bars = ax.bar(positions, speedups, color=colors[i], label=category, alpha=0.8)
+        bars = ax.bar(positions, speedups, color=colors[category], label=category, alpha=0.8,
+                      rasterized=rasterize)
         
-        # Add value labels on bars
-        for bar, speedup in zip(bars, speedups):
-            height = bar.get_height()
-            if not np.isnan(height):
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{speedup:.2f}x',
-                       ha='center', va='bottom', fontsize=8)
-        
-        current_pos += len(category_data) + 1
+        # Add value labels on bars (blank for missing speedups)
+        labels = np.where(np.isnan(speedups), '', np.char.mod('%.2fx', np.nan_to_num(speedups)))
+        ax.bar_label(bars, labels=labels, padding=2, fontsize=8)
     
     # Add horizontal line at y=1 (no speedup)
     ax.axhline(y=1.0, color='red', linestyle='--', linewidth=2, label='No speedup (1x)')
@@ -91,83 +107,70 @@ def plot_speedup_by_category(df, output_file='speedup_by_category.png'):
     ax.grid(axis='y', alpha=0.3)
     
     # Rotate x-axis labels
-    ax.set_xticks(range(len(df)))
-    ax.set_xticklabels(df['name'], rotation=90, ha='right', fontsize=8)
+    ax.set_xticks(np.concatenate(all_positions), names, fontsize=8, **BENCHMARK_TICK_STYLE)
     
-    plt.tight_layout()
+    # Fixed margins; savefig(bbox_inches='tight') still crops to the labels
+    fig.subplots_adjust(left=0.06, right=0.98, top=0.92, bottom=0.2)
     plt.savefig(output_file, dpi=300, bbox_inches='tight')
     print(f"Saved plot to {output_file}")
     plt.close()
 
 
-def plot_absolute_performance(df, output_file='absolute_performance.png'):
-    """Plot absolute performance times"""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+def plot_absolute_performance(groups, colors, names, output_file='absolute_performance.png',
+                              rasterize=True):
+    """Plot absolute performance times (medians; error bars are one IQR wide)"""
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6), sharex=True, sharey=True)
     
-    # Cython performance
-    categories = df['category'].unique()
-    colors = plt.cm.Set3(np.linspace(0, 1, len(categories)))
+    all_positions = _bar_positions(groups)
+    tick_positions = np.concatenate(all_positions)
+    def column(name):
+        return np.concatenate([category_data[name].to_numpy() for _, category_data in groups])
+    cy_times, cy_iqr = column('cython_median_ms'), column('cython_iqr_ms') / 2
+    ct_times, ct_iqr = column('ctypes_median_ms'), column('ctypes_iqr_ms') / 2
+    bar_colors = [colors[category] for (category, _), positions in zip(groups, all_positions)
+                  for _ in positions]
     
-    current_pos = 0
-    for i, category in enumerate(categories):
-        category_data = df[df['category'] == category]
-        positions = np.arange(current_pos, current_pos + len(category_data))
-        
-        cy_times = category_data['cython_mean_ms'].values
-        ct_times = category_data['ctypes_mean_ms'].values
-        
-        ax1.bar(positions, cy_times, color=colors[i], label=category, alpha=0.8)
-        ax2.bar(positions, ct_times, color=colors[i], label=category, alpha=0.8)
-        
-        current_pos += len(category_data) + 1
+    # One bar call per axis; categories are distinguished by color only
+    ax1.bar(tick_positions, cy_times, yerr=cy_iqr, color=bar_colors, alpha=0.8,
+            rasterized=rasterize)
+    ax2.bar(tick_positions, ct_times, yerr=ct_iqr, color=bar_colors, alpha=0.8,
+            rasterized=rasterize)
     
-    ax1.set_xlabel('Benchmark', fontsize=12)
-    ax1.set_ylabel('Time (ms)', fontsize=12)
-    ax1.set_title('Cython Performance', fontsize=14)
+    # Shared axes: the y scale only needs to be configured once
+    ax1.set_ylabel('Median time (ms)', fontsize=12)
     ax1.set_yscale('log')
-    ax1.grid(axis='y', alpha=0.3)
-    ax1.set_xticks(range(len(df)))
-    ax1.set_xticklabels(df['name'], rotation=90, ha='right', fontsize=7)
-    
-    ax2.set_xlabel('Benchmark', fontsize=12)
-    ax2.set_ylabel('Time (ms)', fontsize=12)
-    ax2.set_title('ctypes Performance', fontsize=14)
-    ax2.set_yscale('log')
-    ax2.grid(axis='y', alpha=0.3)
-    ax2.set_xticks(range(len(df)))
-    ax2.set_xticklabels(df['name'], rotation=90, ha='right', fontsize=7)
-    
-    plt.tight_layout()
+    
+    for ax, title in ((ax1, 'Cython Performance'), (ax2, 'ctypes Performance')):
+        ax.set_xlabel('Benchmark', fontsize=12)
+        ax.set_title(title, fontsize=14)
+        ax.grid(axis='y', alpha=0.3)
+        ax.set_xticks(tick_positions, names, fontsize=7, **BENCHMARK_TICK_STYLE)
+    
+    fig.subplots_adjust(left=0.05, right=0.98, top=0.92, bottom=0.25, wspace=0.05)
     plt.savefig(output_file, dpi=300, bbox_inches='tight')
     print(f"Saved plot to {output_file}")
     plt.close()
 
 
-def plot_category_summary(df, output_file='category_summary.png'):
+def plot_category_summary(groups, output_file='category_summary.png', rasterize=True):
     """Plot summary statistics by category"""
-    category_stats = df.groupby('category').agg({
-        'speedup': ['mean', 'median', 'std', 'min', 'max']
-    }).round(2)
-    
-    categories = category_stats.index
-    mean_speedup = category_stats['speedup']['mean'].values
-    median_speedup = category_stats['speedup']['median'].values
+    categories = [category for category, _ in groups]
+    mean_speedup = np.array([data['speedup'].mean() for _, data in groups])
+    median_speedup = np.array([data['speedup'].median() for _, data in groups])
     
     fig, ax = plt.subplots(figsize=(12, 6))
     
     x = np.arange(len(categories))
     width = 0.35
     
-    bars1 = ax.bar(x - width/2, mean_speedup, width, label='Mean Speedup', alpha=0.8)
-    bars2 = ax.bar(x + width/2, median_speedup, width, label='Median Speedup', alpha=0.8)
+    bars1 = ax.bar(x - width/2, mean_speedup, width, label='Mean Speedup', alpha=0.8,
+                   rasterized=rasterize)
+    bars2 = ax.bar(x + width/2, median_speedup, width, label='Median Speedup', alpha=0.8,
+                   rasterized=rasterize)
     
     # Add value labels
     for bars in [bars1, bars2]:
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{height:.2f}x',
-                   ha='center', va='bottom', fontsize=9)
+        ax.bar_label(bars, fmt='%.2fx', padding=2, fontsize=9)
     
     ax.axhline(y=1.0, color='red', linestyle='--', linewidth=2, label='No speedup')
     
@@ -179,132 +182,201 @@ def plot_category_summary(df, output_file='category_summary.png'):
     ax.legend()
     ax.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
+    fig.subplots_adjust(left=0.07, right=0.98, top=0.92, bottom=0.25)
     plt.savefig(output_file, dpi=300, bbox_inches='tight')
     print(f"Saved plot to {output_file}")
     plt.close()
 
 
-def generate_report(data, output_file='benchmark_report.md'):
-    """Generate markdown report"""
-    df = create_summary_table(data)
+def _format_column(values, fmt, na='N/A'):
+    """Format a numeric column as strings in one pass, using `na` for NaN"""
+    values = np.asarray(values, dtype=float)
+    return np.where(np.isnan(values), na, np.char.mod(fmt, np.nan_to_num(values)))
+
+
+def markdown_table(table):
+    """Render a DataFrame of preformatted strings as a markdown table"""
+    if TABULATE_AVAILABLE:
+        return table.to_markdown(index=False, disable_numparse=True) + "\n"
     
-    with open(output_file, 'w') as f:
-        f.write("# Cython vs ctypes Performance Benchmark Report\n\n")
-        
-        # Metadata
-        f.write("## Test Configuration\n\n")
-        f.write(f"- Iterations: {data['metadata']['iterations']}\n")
-        f.write(f"- Warmup: {data['metadata']['warmup']}\n")
-        f.write(f"- Python Version: {data['metadata']['python_version']}\n")
-        f.write(f"- NumPy Version: {data['metadata']['numpy_version']}\n\n")
-        
-        # Overall statistics
-        f.write("## Overall Statistics\n\n")
-        mean_speedup = df['speedup'].mean()
-        median_speedup = df['speedup'].median()
-        f.write(f"- Mean Speedup: {mean_speedup:.2f}x\n")
-        f.write(f"- Median Speedup: {median_speedup:.2f}x\n")
-        f.write(f"- Best Speedup: {df['speedup'].max():.2f}x ({df.loc[df['speedup'].idxmax(), 'name']})\n")
-        f.write(f"- Worst Speedup: {df['speedup'].min():.2f}x ({df.loc[df['speedup'].idxmin(), 'name']})\n\n")
-        
-        # Category breakdown
-        f.write("## Performance by Category\n\n")
-        category_stats = df.groupby('category').agg({
-            'speedup': ['mean', 'median', 'std', 'min', 'max', 'count']
-        }).round(2)
-        
-        f.write("| Category | Mean | Median | Std Dev | Min | Max | Tests |\n")
-        f.write("|----------|------|--------|---------|-----|-----|-------|\n")
-        
-        for category in category_stats.index:
-            stats = category_stats.loc[category, 'speedup']
-            f.write(f"| {category} | {stats['mean']:.2f}x | {stats['median']:.2f}x | ")
-            f.write(f"{stats['std']:.2f} | {stats['min']:.2f}x | {stats['max']:.2f}x | ")
-            f.write(f"{int(stats['count'])} |\n")
-        
-        f.write("\n## Detailed Results\n\n")
-        
-        # Group by category
-        for category in df['category'].unique():
-            f.write(f"### {category}\n\n")
-            f.write("| Benchmark | Cython (ms) | ctypes (ms) | Speedup |\n")
-            f.write("|-----------|-------------|-------------|----------|\n")
-            
-            category_data = df[df['category'] == category]
-            for _, row in category_data.iterrows():
-                cy_time = f"{row['cython_mean_ms']:.4f}" if not pd.isna(row['cython_mean_ms']) else "N/A"
-                ct_time = f"{row['ctypes_mean_ms']:.4f}" if not pd.isna(row['ctypes_mean_ms']) else "N/A"
-                speedup = f"{row['speedup']:.2f}x" if not pd.isna(row['speedup']) else "N/A"
-                f.write(f"| {row['name']} | {cy_time} | {ct_time} | {speedup} |\n")
-            
-            f.write("\n")
-        
-        # Key findings
-        f.write("## Key Findings\n\n")
-        
-        # Find categories where Cython is fastest
-        best_categories = category_stats[category_stats['speedup']['mean'] > 1.5].index.tolist()
-        if best_categories:
-            f.write("### Areas Where Cython Excels (>1.5x speedup)\n\n")
-            for cat in best_categories:
-                mean = category_stats.loc[cat, ('speedup', 'mean')]
-                f.write(f"- **{cat}**: {mean:.2f}x average speedup\n")
-            f.write("\n")
-        
-        # Find categories where performance is similar
-        similar_categories = category_stats[
-            (category_stats['speedup']['mean'] >= 0.8) & 
-            (category_stats['speedup']['mean'] <= 1.2)
-        ].index.tolist()
-        if similar_categories:
-            f.write("### Areas With Similar Performance (0.8x - 1.2x)\n\n")
-            for cat in similar_categories:
-                mean = category_stats.loc[cat, ('speedup', 'mean')]
-                f.write(f"- **{cat}**: {mean:.2f}x average speedup\n")
-            f.write("\n")
+    lines = ["| " + " | ".join(table.columns) + " |",
+             "|" + "|".join("-" * (len(c) + 2) for c in table.columns) + "|"]
+    for row in table.itertuples(index=False, name=None):
+        lines.append("| " + " | ".join(row) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def summarize_categories(gb):
+    """Speedup statistics per category from a category groupby"""
+    return gb['speedup'].agg(['mean', 'median', 'std', 'min', 'max', 'count']).round(2)
+
+
+def summarize_overall(df_valid):
+    """Overall speedup statistics from rows that have a speedup"""
+    speedup = df_valid['speedup']
+    overall = speedup.agg(['mean', 'median', 'min', 'max']).to_dict()
+    overall['best'] = df_valid.loc[speedup.idxmax(), 'name']
+    overall['worst'] = df_valid.loc[speedup.idxmin(), 'name']
+    return overall
+
+
+def generate_report(data, df=None, groups=None, category_stats=None, overall=None,
+                    output_file='benchmark_report.md'):
+    """Generate markdown report (reuses a prebuilt summary table/grouping if given)"""
+    if df is None:
+        df = create_summary_table(data)
+    if overall is None:
+        overall = summarize_overall(df.dropna(subset=['speedup']))
+    if groups is None or category_stats is None:
+        gb = df.groupby('category', sort=False, observed=True)
+        groups = list(gb)
+        category_stats = summarize_categories(gb)
+    
+    # Build the whole report in memory and write it out in one call
+    parts = []
+    
+    parts.append("# Cython vs ctypes Performance Benchmark Report\n\n")
+    
+    # Metadata
+    parts.append("## Test Configuration\n\n")
+    parts.append(f"- Iterations: {data['metadata']['iterations']}\n")
+    parts.append(f"- Warmup: {data['metadata']['warmup']}\n")
+    parts.append(f"- Python Version: {data['metadata']['python_version']}\n")
+    parts.append(f"- NumPy Version: {data['metadata']['numpy_version']}\n\n")
+    
+    # Overall statistics
+    parts.append("## Overall Statistics\n\n")
+    parts.append(f"- Mean Speedup: {overall['mean']:.2f}x\n")
+    parts.append(f"- Median Speedup: {overall['median']:.2f}x\n")
+    parts.append(f"- Best Speedup: {overall['max']:.2f}x ({overall['best']})\n")
+    parts.append(f"- Worst Speedup: {overall['min']:.2f}x ({overall['worst']})\n\n")
+    
+    # Category breakdown
+    parts.append("## Performance by Category\n\n")
+    parts.append(markdown_table(pd.DataFrame({
+        'Category': category_stats.index.astype(str),
+        'Mean': _format_column(category_stats['mean'], '%.2fx'),
+        'Median': _format_column(category_stats['median'], '%.2fx'),
+        'Std Dev': _format_column(category_stats['std'], '%.2f'),
+        'Min': _format_column(category_stats['min'], '%.2fx'),
+        'Max': _format_column(category_stats['max'], '%.2fx'),
+        'Tests': _format_column(category_stats['count'], '%d'),
+    })))
+    
+    parts.append("\n## Detailed Results\n\n")
+    
+    # Format every row once up front; each category then just selects its rows
+    detailed = pd.DataFrame({
+        'Benchmark': df['name'].astype(str),
+        'Cython median (ms)': _format_column(df['cython_median_ms'], '%.4f'),
+        'Cython IQR (ms)': _format_column(df['cython_iqr_ms'], '%.4f'),
+        'ctypes median (ms)': _format_column(df['ctypes_median_ms'], '%.4f'),
+        'ctypes IQR (ms)': _format_column(df['ctypes_iqr_ms'], '%.4f'),
+        'Speedup': _format_column(df['speedup'], '%.2fx'),
+    }, index=df.index)
+    
+    # Group by category
+    for category, category_data in groups:
+        parts.append(f"### {category}\n\n")
+        parts.append(markdown_table(detailed.loc[category_data.index]))
         
-        # Recommendations
-        f.write("## Recommendations\n\n")
-        f.write("Based on the benchmark results:\n\n")
-        f.write("1. **Use Cython for**: ")
-        f.write(", ".join(best_categories) if best_categories else "N/A")
-        f.write("\n")
-        f.write("2. **Either Cython or ctypes acceptable for**: ")
-        f.write(", ".join(similar_categories) if similar_categories else "N/A")
-        f.write("\n")
-        f.write("3. **Consider implementation complexity**: Cython requires compilation, ")
-        f.write("ctypes is more flexible for runtime binding\n")
+        parts.append("\n")
+    
+    # Key findings
+    parts.append("## Key Findings\n\n")
+    
+    # Find categories where Cython is fastest
+    best_categories = category_stats[category_stats['mean'] > 1.5].index.tolist()
+    if best_categories:
+        parts.append("### Areas Where Cython Excels (>1.5x speedup)\n\n")
+        for cat in best_categories:
+            mean = category_stats.loc[cat, 'mean']
+            parts.append(f"- **{cat}**: {mean:.2f}x average speedup\n")
+        parts.append("\n")
+    
+    # Find categories where performance is similar
+    similar_categories = category_stats[
+        (category_stats['mean'] >= 0.8) & 
+        (category_stats['mean'] <= 1.2)
+    ].index.tolist()
+    if similar_categories:
+        parts.append("### Areas With Similar Performance (0.8x - 1.2x)\n\n")
+        for cat in similar_categories:
+            mean = category_stats.loc[cat, 'mean']
+            parts.append(f"- **{cat}**: {mean:.2f}x average speedup\n")
+        parts.append("\n")
+    
+    # Recommendations
+    parts.append("## Recommendations\n\n")
+    parts.append("Based on the benchmark results:\n\n")
+    parts.append("1. **Use Cython for**: ")
+    parts.append(", ".join(best_categories) if best_categories else "N/A")
+    parts.append("\n")
+    parts.append("2. **Either Cython or ctypes acceptable for**: ")
+    parts.append(", ".join(similar_categories) if similar_categories else "N/A")
+    parts.append("\n")
+    parts.append("3. **Consider implementation complexity**: Cython requires compilation, ")
+    parts.append("ctypes is more flexible for runtime binding\n")
+    
+    with open(output_file, 'w') as f:
+        f.write(''.join(parts))
     
     print(f"Report saved to {output_file}")
 
 
-def main():
+def parse_args(argv=None):
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--no-plots', action='store_true',
+                        help='skip generating the PNG plots')
+    parser.add_argument('--no-report', action='store_true',
+                        help='skip writing the markdown report')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Main analysis function"""
+    args = parse_args(argv)
+    
     # Load results
     data = load_results()
     df = create_summary_table(data)
     
+    # Group once and share one color per category across all plots
+    categories = df['category'].unique()
+    colors = dict(zip(categories, _palette(len(categories))))
+    gb = df.groupby('category', sort=False, observed=True)
+    groups = list(gb)
+    category_stats = summarize_categories(gb)
+    
+    # Statistics only look at benchmarks with a speedup (memory-only runs have none)
+    df_valid = df.dropna(subset=['speedup'])
+    overall = summarize_overall(df_valid)
+    
     # Create visualizations
-    plot_speedup_by_category(df)
-    plot_absolute_performance(df)
-    plot_category_summary(df)
+    if not args.no_plots:
+        # Benchmark names in plotting (grouped) order, shared by both per-benchmark plots
+        names = np.concatenate([category_data['name'].to_numpy() for _, category_data in groups])
+        plot_speedup_by_category(groups, colors, names)
+        plot_absolute_performance(groups, colors, names)
+        plot_category_summary(groups)
     
     # Generate report
-    generate_report(data)
+    if not args.no_report:
+        generate_report(data, df=df, groups=groups, category_stats=category_stats,
+                        overall=overall)
     
     # Print summary to console
     print("\n" + "="*80)
     print("ANALYSIS SUMMARY")
     print("="*80)
-    print(f"\nMean speedup: {df['speedup'].mean():.2f}x")
-    print(f"Median speedup: {df['speedup'].median():.2f}x")
-    print(f"Best speedup: {df['speedup'].max():.2f}x")
-    print(f"Worst speedup: {df['speedup'].min():.2f}x")
+    print(f"\nMean speedup: {overall['mean']:.2f}x")
+    print(f"Median speedup: {overall['median']:.2f}x")
+    print(f"Best speedup: {overall['max']:.2f}x")
+    print(f"Worst speedup: {overall['min']:.2f}x")
     
     print("\nBy category:")
-    category_stats = df.groupby('category')['speedup'].mean().sort_values(ascending=False)
-    for category, speedup in category_stats.items():
+    for category, speedup in category_stats['mean'].dropna().sort_values(ascending=False).items():
         print(f"  {category}: {speedup:.2f}x")
 
 
@@ -8,14 +8,24 @@ import gc
 import sys
 import os
 import json
+import random
+import contextlib
+import io
 from collections import defaultdict
 import tracemalloc
+import resource
 import psutil
 
 # Add paths for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))  # For ctypes_wrapper
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))  # For cython_wrapper (built in root)
 
+# libgomp sizes its thread team when the extensions load it. The suite pins
+# itself to one CPU, so default to a single OpenMP thread before importing
+# them rather than oversubscribing that CPU
+if __name__ == '__main__':
+    os.environ.setdefault('OMP_NUM_THREADS', '1')
+
 # Import wrappers
 try:
     import cython_wrapper as cy
@@ -31,42 +41,92 @@ except ImportError:
     CTYPES_AVAILABLE = False
     print("Warning: ctypes wrapper not available")
 
+try:
+    from _bench_harness import time_calls_ns
+    HARNESS_AVAILABLE = True
+except ImportError:
+    HARNESS_AVAILABLE = False
+    print("Warning: C timing harness not available, timing in Python")
+
+# Timer overhead, as a fraction of a batch, above which results are flagged
+# and the fraction a fixed batch size is grown to stay under
+OVERHEAD_WARN = 0.10
+OVERHEAD_TARGET = 0.01
+
+# ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+MAXRSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
 
 class BenchmarkResult:
     """Store benchmark results"""
-    def __init__(self, name, category):
+    def __init__(self, name, category, iterations=0):
         self.name = name
         self.category = category
-        self.cython_times = []
-        self.ctypes_times = []
+        # Preallocated buffers of whole-batch nanoseconds, filled up to the
+        # per-framework counters; get_stats converts them to seconds per call
+        self.cython_times = np.empty(iterations, dtype=np.int64)
+        self.ctypes_times = np.empty(iterations, dtype=np.int64)
+        self._cy_count = 0
+        self._ct_count = 0
+        self.batch_size = None
+        # Timer overhead as a fraction of one batch of the faster framework
+        self.overhead = None
         self.cython_memory = None
         self.ctypes_memory = None
         self.params = {}
+        # Stats per framework, computed on first request and dropped on new timings
+        self._stats = {}
         
-    def add_timing(self, framework, elapsed_time):
+    def add_timing(self, framework, elapsed_ns):
         if framework == 'cython':
-            self.cython_times.append(elapsed_time)
+            self.cython_times[self._cy_count] = elapsed_ns
+            self._cy_count += 1
         else:
-            self.ctypes_times.append(elapsed_time)
+            self.ctypes_times[self._ct_count] = elapsed_ns
+            self._ct_count += 1
+        self._stats.pop(framework, None)
     
     def get_stats(self, framework):
-        times = self.cython_times if framework == 'cython' else self.ctypes_times
-        if not times:
+        if framework not in self._stats:
+            self._stats[framework] = self._compute_stats(framework)
+        return self._stats[framework]
+    
+    def _compute_stats(self, framework):
+        if framework == 'cython':
+            times = self.cython_times[:self._cy_count]
+        else:
+            times = self.ctypes_times[:self._ct_count]
+        if times.size == 0:
             return None
+        times = times * (1e-9 / (self.batch_size or 1))
+        # One sort-based pass gives min, quartiles, median and max together
+        lo, q1, median, q3, hi = np.percentile(times, [0, 25, 50, 75, 100])
+        mean = times.mean()
         return {
-            'mean': np.mean(times),
-            'median': np.median(times),
-            'std': np.std(times),
-            'min': np.min(times),
-            'max': np.max(times),
-            'throughput': 1.0 / np.mean(times) if np.mean(times) > 0 else 0
+            'mean': mean,
+            'median': median,
+            'std': times.std(),
+            'iqr': q3 - q1,
+            'min': lo,
+            'max': hi,
+            'throughput': 1.0 / mean if mean > 0 else 0
         }
     
+    def speedup(self):
+        """ctypes/Cython ratio of median times, or None if either side is missing"""
+        cy_stats = self.get_stats('cython')
+        ct_stats = self.get_stats('ctypes')
+        if cy_stats and ct_stats:
+            return ct_stats['median'] / cy_stats['median']
+        return None
+    
     def to_dict(self):
         result = {
             'name': self.name,
             'category': self.category,
             'params': self.params,
+            'batch_size': self.batch_size,
+            'overhead': self.overhead,
             'cython': self.get_stats('cython'),
             'ctypes': self.get_stats('ctypes'),
         }
@@ -76,9 +136,9 @@ class BenchmarkResult:
         if self.ctypes_memory:
             result['ctypes_memory'] = self.ctypes_memory
             
-        # Calculate speedup
-        if result['cython'] and result['ctypes']:
-            result['speedup'] = result['ctypes']['mean'] / result['cython']['mean']
+        speedup = self.speedup()
+        if speedup is not None:
+            result['speedup'] = speedup
         
         return result
 
@@ -86,124 +146,196 @@ class BenchmarkResult:
 class BenchmarkRunner:
     """Run benchmarks and collect results"""
     
-    def __init__(self, iterations=100, warmup=10):
+    MAX_BATCH_SIZE = 1 << 20
+
+    def __init__(self, iterations=100, warmup=10, batch_size=None, min_batch_time=10e-6,
+                 interleave_blocks=10):
         self.iterations = iterations
         self.warmup = warmup
+        self.interleave_blocks = interleave_blocks
+        # None auto-tunes the batch size per benchmark
+        self.batch_size = batch_size
+        self.min_batch_time = min_batch_time
+        self._timer_overhead_ns = self._measure_timer_overhead()
         self.results = []
+    
+    @property
+    def timer_overhead(self):
+        """Cost of one pair of timer reads, in seconds"""
+        return self._timer_overhead_ns * 1e-9
+    
+    def _measure_timer_overhead(self, samples=10000):
+        """Median time of an empty batch from _time_batch, in nanoseconds
+
+        Uses the same timer the samples do (the C harness when available), so
+        only the fixed cost of the clock reads around a batch is counted.
+        """
+        deltas = np.empty(samples, dtype=np.int64)
+        noop = lambda: None
+        for i in range(samples):
+            deltas[i] = self._time_batch(noop, (), 0)
+        return float(np.median(deltas))
+    
+    def _time_batch(self, func, args, n):
+        """Time one batch of n calls and return the total in nanoseconds"""
+        if HARNESS_AVAILABLE:
+            return time_calls_ns(func, args, n)
+        start = time.perf_counter_ns()
+        for _ in range(n):
+            func(*args)
+        return time.perf_counter_ns() - start
+
+    @staticmethod
+    def _split(total, parts):
+        """Split total into parts near-equal block sizes"""
+        base, extra = divmod(total, parts)
+        return [base + (i < extra) for i in range(parts)]
+
+    def _limit_overhead(self, funcs, args, batch_size):
+        """Grow batch_size until timer overhead is under OVERHEAD_TARGET of a batch"""
+        # Probe with a calibrated batch so the estimate is not itself timer-bound
+        per_call_ns = float('inf')
+        for func in funcs:
+            n = self._calibrate(func, args)
+            per_call_ns = min(per_call_ns, self._time_batch(func, args, n) / n)
+        if per_call_ns <= 0 or self._timer_overhead_ns <= OVERHEAD_WARN * per_call_ns * batch_size:
+            return batch_size
+        needed = int(np.ceil(self._timer_overhead_ns / (OVERHEAD_TARGET * per_call_ns)))
+        return min(max(needed, batch_size), self.MAX_BATCH_SIZE)
+
+    def _calibrate(self, func, args):
+        """Smallest power-of-two batch size that takes at least min_batch_time"""
+        n = 1
+        while n < self.MAX_BATCH_SIZE:
+            if self._time_batch(func, args, n) >= self.min_batch_time * 1e9:
+                break
+            n *= 2
+        return n
+
+    def _warmup(self, func, args, label):
+        """Check func with one guarded call, then warm it up; return False if it raises"""
+        try:
+            func(*args)
+        except Exception as e:
+            print(f"{label} warmup error: {e}")
+            return False
+        # Known-good from here on: warm up through the same loop that is timed
+        if self.warmup > 1:
+            self._time_batch(func, args, self.warmup - 1)
+        return True
         
     def run_benchmark(self, name, category, cython_func, ctypes_func, *args, **kwargs):
         """Run a single benchmark"""
         print(f"Running {name}...", end=' ', flush=True)
         
-        result = BenchmarkResult(name, category)
+        result = BenchmarkResult(name, category, self.iterations)
         result.params = kwargs.get('params', {})
         
         # Force garbage collection
         gc.collect()
         
-        # Warmup phase
-        if CYTHON_AVAILABLE:
-            for _ in range(self.warmup):
-                try:
-                    cython_func(*args)
-                except Exception as e:
-                    print(f"Cython warmup error: {e}")
-        
-        if CTYPES_AVAILABLE:
-            for _ in range(self.warmup):
-                try:
-                    ctypes_func(*args)
-                except Exception as e:
-                    print(f"ctypes warmup error: {e}")
-        
-        # Benchmark Cython
-        if CYTHON_AVAILABLE:
-            gc.collect()
-            for _ in range(self.iterations):
-                start = time.perf_counter()
-                try:
-                    cython_func(*args)
-                except Exception as e:
-                    print(f"Cython error: {e}")
-                    break
-                elapsed = time.perf_counter() - start
-                result.add_timing('cython', elapsed)
-        
-        # Benchmark ctypes
-        if CTYPES_AVAILABLE:
-            gc.collect()
-            for _ in range(self.iterations):
-                start = time.perf_counter()
-                try:
-                    ctypes_func(*args)
-                except Exception as e:
-                    print(f"ctypes error: {e}")
-                    break
-                elapsed = time.perf_counter() - start
-                result.add_timing('ctypes', elapsed)
+        # Warmup phase; a function that fails here is not timed at all,
+        # so the measurement loops below need no exception handling
+        run_cython = CYTHON_AVAILABLE and self._warmup(cython_func, args, "Cython")
+        run_ctypes = CTYPES_AVAILABLE and self._warmup(ctypes_func, args, "ctypes")
+        
+        funcs = {}
+        if run_cython:
+            funcs['cython'] = cython_func
+        if run_ctypes:
+            funcs['ctypes'] = ctypes_func
+        
+        # Both sides share one batch size, sized for the faster function
+        batch_size = self.batch_size
+        if batch_size is None:
+            batch_size = max([self._calibrate(f, args) for f in funcs.values()], default=1)
+        elif HARNESS_AVAILABLE and funcs:
+            batch_size = self._limit_overhead(funcs.values(), args, batch_size)
+        result.batch_size = batch_size
+        
+        # Measure in blocks of samples, shuffling Cython and ctypes blocks so
+        # drift in clock speed or cache state does not favour either side
+        blocks = max(1, min(self.interleave_blocks, self.iterations))
+        block_sizes = {fw: self._split(self.iterations, blocks) for fw in funcs}
+        schedule = [fw for fw in funcs for _ in range(blocks)]
+        random.shuffle(schedule)
+        
+        # Keep the cyclic GC from kicking in mid-measurement; the timing
+        # buffers were allocated up front, so nothing here needs it
+        gc.collect()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for fw in schedule:
+                func = funcs[fw]
+                for _ in range(block_sizes[fw].pop()):
+                    result.add_timing(fw, self._time_batch(func, args, batch_size))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        
+        means = [stats['mean'] for stats in map(result.get_stats, funcs) if stats]
+        if means and min(means) > 0:
+            result.overhead = self.timer_overhead / (min(means) * batch_size)
         
         self.results.append(result)
         
         # Print quick summary
-        cy_stats = result.get_stats('cython')
-        ct_stats = result.get_stats('ctypes')
-        if cy_stats and ct_stats:
-            speedup = ct_stats['mean'] / cy_stats['mean']
-            print(f"Speedup: {speedup:.2f}x")
+        speedup = result.speedup()
+        if speedup is not None:
+            print(f"Speedup: {speedup:.2f}x", end='')
         else:
-            print("Done")
+            print("Done", end='')
+        if result.overhead is not None and result.overhead > OVERHEAD_WARN:
+            print(f" (warning: timer overhead {result.overhead:.0%})", end='')
+        print()
         
         return result
     
-    def run_memory_benchmark(self, name, category, cython_func, ctypes_func, *args):
+    def _measure_memory(self, func, args, label, track_python_allocs):
+        """Run func once and report how much memory it took"""
+        gc.collect()
+        if track_python_allocs:
+            tracemalloc.start()
+        process = psutil.Process()
+        mem_before = process.memory_info().rss
+        maxrss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        
+        try:
+            func(*args)
+        except Exception as e:
+            print(f"{label} error: {e}")
+        
+        maxrss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        mem_after = process.memory_info().rss
+        
+        memory = {
+            'maxrss_delta': (maxrss_after - maxrss_before) * MAXRSS_UNIT,
+            'rss_delta': mem_after - mem_before
+        }
+        if track_python_allocs:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            memory['current'] = current
+            memory['peak'] = peak
+        return memory
+    
+    def run_memory_benchmark(self, name, category, cython_func, ctypes_func, *args,
+                             track_python_allocs=False):
         """Run benchmark with memory tracking"""
         print(f"Running {name} (with memory tracking)...", end=' ', flush=True)
         
         result = BenchmarkResult(name, category)
         
-        # Benchmark Cython with memory tracking
+        # ru_maxrss and RSS see allocations made inside C; tracemalloc only sees
+        # Python allocations and slows every one of them down, so it is opt-in
         if CYTHON_AVAILABLE:
-            gc.collect()
-            tracemalloc.start()
-            process = psutil.Process()
-            mem_before = process.memory_info().rss
-            
-            try:
-                cython_func(*args)
-            except Exception as e:
-                print(f"Cython error: {e}")
-            
-            current, peak = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-            mem_after = process.memory_info().rss
-            
-            result.cython_memory = {
-                'current': current,
-                'peak': peak,
-                'rss_delta': mem_after - mem_before
-            }
+            result.cython_memory = self._measure_memory(
+                cython_func, args, "Cython", track_python_allocs)
         
-        # Benchmark ctypes with memory tracking
         if CTYPES_AVAILABLE:
-            gc.collect()
-            tracemalloc.start()
-            process = psutil.Process()
-            mem_before = process.memory_info().rss
-            
-            try:
-                ctypes_func(*args)
-            except Exception as e:
-                print(f"ctypes error: {e}")
-            
-            current, peak = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-            mem_after = process.memory_info().rss
-            
-            result.ctypes_memory = {
-                'current': current,
-                'peak': peak,
-                'rss_delta': mem_after - mem_before
-            }
+            result.ctypes_memory = self._measure_memory(
+                ctypes_func, args, "ctypes", track_python_allocs)
         
         self.results.append(result)
         print("Done")
@@ -215,10 +347,18 @@ class BenchmarkRunner:
             'metadata': {
                 'iterations': self.iterations,
                 'warmup': self.warmup,
+                'batch_size': self.batch_size,
+                'min_batch_time': self.min_batch_time,
+                'interleave_blocks': self.interleave_blocks,
+                'timer_overhead_ns': self._timer_overhead_ns,
+                'c_harness': HARNESS_AVAILABLE,
                 'cython_available': CYTHON_AVAILABLE,
                 'ctypes_available': CTYPES_AVAILABLE,
                 'python_version': sys.version,
-                'numpy_version': np.__version__
+                'numpy_version': np.__version__,
+                'omp_num_threads': os.environ.get('OMP_NUM_THREADS'),
+                'cpu_affinity': (sorted(os.sched_getaffinity(0))
+                                 if hasattr(os, 'sched_getaffinity') else None)
             },
             'results': [r.to_dict() for r in self.results]
         }
@@ -231,7 +371,7 @@ class BenchmarkRunner:
     def print_summary(self):
         """Print summary of results"""
         print("\n" + "="*80)
-        print("BENCHMARK SUMMARY")
+        print("BENCHMARK SUMMARY (median time per call)")
         print("="*80)
         
         # Group by category
@@ -242,35 +382,63 @@ class BenchmarkRunner:
         for category, results in sorted(by_category.items()):
             print(f"\n{category}:")
             print("-" * 80)
-            print(f"{'Benchmark':<40} {'Cython (ms)':<15} {'ctypes (ms)':<15} {'Speedup':<10}")
+            print(f"{'Benchmark':<40} {'Cython (ms)':<15} {'ctypes (ms)':<15} {'Speedup':<10} {'Overhead'}")
             print("-" * 80)
             
             for result in results:
+                if result.overhead is None:
+                    overhead = ''
+                else:
+                    overhead = f"{result.overhead:.1%}"
+                    if result.overhead > OVERHEAD_WARN:
+                        overhead += " (!)"
                 cy_stats = result.get_stats('cython')
                 ct_stats = result.get_stats('ctypes')
                 
                 if cy_stats and ct_stats:
-                    cy_mean = cy_stats['mean'] * 1000
-                    ct_mean = ct_stats['mean'] * 1000
-                    speedup = ct_stats['mean'] / cy_stats['mean']
-                    print(f"{result.name:<40} {cy_mean:<15.4f} {ct_mean:<15.4f} {speedup:<10.2f}x")
+                    cy_median = cy_stats['median'] * 1000
+                    ct_median = ct_stats['median'] * 1000
+                    speedup = result.speedup()
+                    print(f"{result.name:<40} {cy_median:<15.4f} {ct_median:<15.4f} {speedup:<9.2f}x {overhead}")
                 elif cy_stats:
-                    cy_mean = cy_stats['mean'] * 1000
-                    print(f"{result.name:<40} {cy_mean:<15.4f} {'N/A':<15} {'N/A':<10}")
+                    cy_median = cy_stats['median'] * 1000
+                    print(f"{result.name:<40} {cy_median:<15.4f} {'N/A':<15} {'N/A':<10} {overhead}")
                 elif ct_stats:
-                    ct_mean = ct_stats['mean'] * 1000
-                    print(f"{result.name:<40} {'N/A':<15} {ct_mean:<15.4f} {'N/A':<10}")
+                    ct_median = ct_stats['median'] * 1000
+                    print(f"{result.name:<40} {'N/A':<15} {ct_median:<15.4f} {'N/A':<10} {overhead}")
         
         print("\n" + "="*80)
 
 
-def run_all_benchmarks():
-    """Run all benchmarks"""
-    runner = BenchmarkRunner(iterations=1000, warmup=50)
-    
-    print("Starting comprehensive Cython vs ctypes benchmark suite")
-    print(f"Iterations: {runner.iterations}, Warmup: {runner.warmup}\n")
-    
+def pin_process():
+    """Pin to one CPU per OpenMP thread and return the CPU set
+
+    SCHED_FIFO is requested, where permitted, only when a single thread runs:
+    FIFO threads sharing a CPU do not preempt each other.
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return None
+    try:
+        threads = max(1, int(os.environ.get('OMP_NUM_THREADS', '1').split(',')[0]))
+    except ValueError:
+        threads = 1
+    # Prefer the last allowed CPUs; CPU 0 tends to service most interrupts
+    cpus = set(sorted(os.sched_getaffinity(0))[-threads:])
+    try:
+        os.sched_setaffinity(0, cpus)
+    except OSError:
+        return None
+    if len(cpus) == 1 and threads == 1:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO,
+                                  os.sched_param(os.sched_get_priority_min(os.SCHED_FIFO)))
+        except (AttributeError, OSError):
+            pass
+    return cpus
+
+
+def run_suite(runner):
+    """Run every benchmark in the suite through runner"""
     # ========================================================================
     # 1. FUNCTION CALL OVERHEAD
     # ========================================================================
@@ -305,12 +473,16 @@ def run_all_benchmarks():
     print("="*80)
     
     if CYTHON_AVAILABLE and CTYPES_AVAILABLE:
-        runner.run_benchmark(
-            "fibonacci_recursive(20)",
-            "Compute-Intensive",
-            cy.cy_fibonacci_recursive, ct.ct_fibonacci_recursive, 20,
-            params={'n': 20}
-        )
+        # n=20 runs in microseconds and relies on batching to stay above the
+        # timer's resolution; n=30 takes milliseconds, so the recursion in C
+        # dominates whatever the FFI and timer add
+        for n in [20, 30]:
+            runner.run_benchmark(
+                f"fibonacci_recursive({n})",
+                "Compute-Intensive",
+                cy.cy_fibonacci_recursive, ct.ct_fibonacci_recursive, n,
+                params={'n': n}
+            )
         
         runner.run_benchmark(
             "fibonacci_iterative(1000)",
@@ -333,16 +505,16 @@ def run_all_benchmarks():
             params={'range': [1, 10000]}
         )
         
-        # Matrix multiplication
-        size = 50
-        A = np.random.rand(size, size)
-        B = np.random.rand(size, size)
-        runner.run_benchmark(
-            f"matrix_multiply({size}x{size})",
-            "Compute-Intensive",
-            cy.cy_matrix_multiply, ct.ct_matrix_multiply, A.copy(), B.copy(),
-            params={'size': size}
-        )
+        # Matrix multiplication (10 has a fixed-size kernel, 50 does not)
+        for size in [10, 50]:
+            A = np.random.rand(size, size)
+            B = np.random.rand(size, size)
+            runner.run_benchmark(
+                f"matrix_multiply({size}x{size})",
+                "Compute-Intensive",
+                cy.cy_matrix_multiply, ct.ct_matrix_multiply, A.copy(), B.copy(),
+                params={'size': size}
+            )
         
         runner.run_benchmark(
             "compute_math_intensive(1.5, 10000)",
@@ -382,6 +554,13 @@ def run_all_benchmarks():
             cy.cy_copy_array, ct.ct_copy_array, arr.copy()
         )
         
+        runner.run_benchmark(
+            "copy_array(size=100000, out)",
+            "Memory-Intensive",
+            cy.cy_copy_array, ct.ct_copy_array, arr.copy(), np.empty(100000),
+            params={'size': 100000}
+        )
+        
         a = np.random.rand(100000)
         b = np.random.rand(100000)
         runner.run_benchmark(
@@ -412,17 +591,18 @@ def run_all_benchmarks():
     print("="*80)
     
     if CYTHON_AVAILABLE and CTYPES_AVAILABLE:
-        # String operations
-        test_string = "Hello, World! " * 10
+        # String operations; inputs are encoded up front so UTF-8 encoding
+        # is not timed as part of the FFI call
+        test_bytes = ("Hello, World! " * 10).encode('utf-8')
         runner.run_benchmark(
             "string_length(150 chars)",
             "Data Marshalling",
-            cy.cy_string_length, ct.ct_string_length, test_string,
-            params={'length': len(test_string)}
+            cy.cy_string_length, ct.ct_string_length, test_bytes,
+            params={'length': len(test_bytes)}
         )
         
-        s1 = "Hello" * 20
-        s2 = "World" * 20
+        s1 = ("Hello" * 20).encode('utf-8')
+        s2 = ("World" * 20).encode('utf-8')
         runner.run_benchmark(
             "string_concat(100+100 chars)",
             "Data Marshalling",
@@ -444,6 +624,16 @@ def run_all_benchmarks():
             cy.cy_sum_datapoints, ct.ct_sum_datapoints, points,
             params={'count': 100}
         )
+        
+        # Same call on a struct array built once up front, so the difference
+        # from the benchmark above is the cost of marshalling the tuples
+        prepared = ct.make_datapoints(points)
+        runner.run_benchmark(
+            "sum_datapoints_prepared(100 structs)",
+            "Data Marshalling",
+            cy.cy_sum_datapoints_prepared, ct.ct_sum_datapoints_prepared, prepared,
+            params={'count': 100}
+        )
     
     # ========================================================================
     # 5. MIXED WORKLOADS
@@ -527,6 +717,43 @@ def run_all_benchmarks():
             "Buffer Processing",
             cy.cy_checksum, ct.ct_checksum, buffer.copy()
         )
+        
+        runner.run_benchmark(
+            "process_and_checksum(100000)",
+            "Buffer Processing",
+            cy.cy_process_and_checksum, ct.ct_process_and_checksum, buffer.copy(),
+            params={'size': 100000}
+        )
+        
+        runner.run_benchmark(
+            "sha256(100000)",
+            "Buffer Processing",
+            cy.cy_sha256, ct.ct_sha256, buffer.copy(),
+            params={'size': 100000}
+        )
+        
+        # Many small buffers in a single FFI call
+        buffers = [np.random.randint(0, 256, 64, dtype=np.uint8) for _ in range(1000)]
+        runner.run_benchmark(
+            "process_buffers(1000 x 64)",
+            "Buffer Processing",
+            cy.cy_process_buffers, ct.ct_process_buffers, [b.copy() for b in buffers],
+            params={'count': 1000, 'size': 64}
+        )
+        
+        runner.run_benchmark(
+            "checksum_many(1000 x 64)",
+            "Buffer Processing",
+            cy.cy_checksum_many, ct.ct_checksum_many, buffers,
+            params={'count': 1000, 'size': 64}
+        )
+        
+        runner.run_benchmark(
+            "filter_buffer(100000)",
+            "Buffer Processing",
+            cy.cy_filter_buffer, ct.ct_filter_buffer, buffer.copy(), 0,
+            params={'size': 100000}
+        )
     
     # ========================================================================
     # 9. POINTER-INTENSIVE OPERATIONS
@@ -542,6 +769,13 @@ def run_all_benchmarks():
             cy.cy_list_operations, ct.ct_list_operations, 1000,
             params={'size': 1000}
         )
+        
+        runner.run_benchmark(
+            "list_operations_soa(1000)",
+            "Pointer-Intensive",
+            cy.cy_list_operations_soa, ct.ct_list_operations_soa, 1000,
+            params={'size': 1000}
+        )
     
     # ========================================================================
     # 10. BITWISE OPERATIONS
@@ -564,6 +798,44 @@ def run_all_benchmarks():
             cy.cy_bitwise_reduce, ct.ct_bitwise_reduce, arr.copy(),
             params={'size': 10000}
         )
+        
+        # Many small reductions driven from C instead of a Python loop
+        rows = np.random.randint(0, 2**32, (1000, 64), dtype=np.uint32)
+        runner.run_benchmark(
+            "bitwise_reduce_many(1000 x 64)",
+            "Bitwise Operations",
+            cy.cy_bitwise_reduce_many, ct.ct_bitwise_reduce_many, rows,
+            params={'count': 1000, 'size': 64}
+        )
+        
+        runner.run_benchmark(
+            "popcount_array(10000)",
+            "Bitwise Operations",
+            cy.cy_popcount_array, ct.ct_popcount_array, arr.copy(),
+            params={'size': 10000}
+        )
+
+
+def run_all_benchmarks():
+    """Run all benchmarks"""
+    cpus = pin_process()
+    if cpus is not None:
+        print(f"Pinned to CPU(s) {', '.join(map(str, sorted(cpus)))} "
+              f"with OMP_NUM_THREADS={os.environ.get('OMP_NUM_THREADS', 'unset')}")
+    
+    # Prime caches, the CPU frequency governor and lazily initialised code
+    # paths with one discarded pass, so the first real benchmark is not cold
+    print("Priming: running the suite once and discarding the results...")
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_suite(BenchmarkRunner(iterations=100, warmup=0))
+    gc.collect()
+    
+    runner = BenchmarkRunner(iterations=1000, warmup=50)
+    
+    print("Starting comprehensive Cython vs ctypes benchmark suite")
+    print(f"Iterations: {runner.iterations}, Warmup: {runner.warmup}\n")
+    
+    run_suite(runner)
     
     # Print and save results
     runner.print_summary()
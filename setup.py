@@ -6,17 +6,36 @@ from setuptools import setup, Extension
 from Cython.Build import cythonize
 import numpy as np
 import os
+import shlex
 
 # C library source files
 c_sources = ['src/benchmark_lib.c']
 
+# Optimisation flags; keep in sync with OPTFLAGS in the Makefile so both
+# FFIs call the same machine code. -ffast-math is deliberately left out:
+# it relaxes IEEE semantics and, in a shared object, sets flush-to-zero
+# for the whole process (NumPy included). An OPTFLAGS environment variable
+# overrides the defaults; `make OPTFLAGS=...` passes its value through.
+opt_flags = shlex.split(os.environ.get('OPTFLAGS', '')) or [
+    '-O3', '-march=native', '-flto', '-funroll-loops', '-ftree-vectorize',
+    '-fopenmp', '-fno-plt', '-fno-semantic-interposition']
+
 # Cython extension
 cython_extensions = [
     Extension(
         "cython_wrapper",
         sources=["src/cython_wrapper.pyx"] + c_sources,
         include_dirs=[np.get_include(), "src"],
-        extra_compile_args=['-O3', '-march=native', '-fPIC'],
+        extra_compile_args=opt_flags + ['-fPIC'],
+        extra_link_args=opt_flags,
+        language="c"
+    ),
+    # C-level timing loop used by benchmarks/benchmark_runner.py
+    Extension(
+        "_bench_harness",
+        sources=["src/_bench_harness.pyx"],
+        extra_compile_args=opt_flags + ['-fPIC'],
+        extra_link_args=opt_flags,
         language="c"
     )
 ]
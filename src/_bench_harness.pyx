@@ -0,0 +1,27 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+
+"""
+Low-overhead timing harness: runs the call loop in C so that the
+measurement itself adds as little as possible to each FFI call.
+"""
+
+from cpython.ref cimport PyObject
+from posix.time cimport clock_gettime, timespec, CLOCK_MONOTONIC
+
+cdef extern from "Python.h":
+    object PyObject_Call(object callable_object, object args, PyObject* kw)
+
+cdef inline long long _now_ns() noexcept nogil:
+    cdef timespec ts
+    clock_gettime(CLOCK_MONOTONIC, &ts)
+    return <long long>ts.tv_sec * 1000000000 + ts.tv_nsec
+
+cpdef long long time_calls_ns(object func, tuple args, Py_ssize_t n) except? -1:
+    """Call func(*args) n times in a C loop and return total elapsed nanoseconds"""
+    cdef Py_ssize_t i
+    cdef long long start = _now_ns()
+    for i in range(n):
+        PyObject_Call(func, args, NULL)
+    return _now_ns() - start
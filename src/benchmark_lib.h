@@ -52,6 +52,11 @@ double apply_operation(double initial, int iterations);
 // Buffer processing
 void process_buffer(unsigned char* buffer, int size);
 unsigned int checksum(unsigned char* buffer, int size);
+unsigned int process_and_checksum(unsigned char* buffer, int size);
+void sha256(unsigned char* buffer, int size, unsigned char* out);
+void process_buffers(unsigned char** buffers, int* sizes, int count);
+void checksum_many(unsigned char** buffers, int* sizes, int count, unsigned int* out);
+int filter_buffer(unsigned char* in, int size, unsigned char pattern, unsigned char* out);
 
 // Pointer-intensive
 typedef struct Node {
@@ -63,9 +68,21 @@ Node* create_list(int size);
 int sum_list(Node* head);
 void free_list(Node* head);
 
+typedef struct {
+    int size;
+    int* values;
+    int* nexts;
+} IndexedList;
+
+IndexedList* create_list_soa(int size);
+int sum_list_soa(IndexedList* list);
+void free_list_soa(IndexedList* list);
+
 // Bitwise operations
 int popcount(unsigned int n);
 unsigned int bitwise_reduce(unsigned int* arr, int size);
+void bitwise_reduce_many(unsigned int* arr, int rows, int cols, unsigned int* out);
+unsigned long long popcount_array(unsigned int* arr, int size);
 
 #endif // BENCHMARK_LIB_H
 
@@ -6,6 +6,7 @@ import ctypes
 import numpy as np
 from numpy.ctypeslib import ndpointer
 import os
+import threading
 
 # Load the shared library
 lib_path = os.path.join(os.path.dirname(__file__), 'libbenchmark.so')
@@ -15,7 +16,17 @@ if not os.path.exists(lib_path):
     if not os.path.exists(lib_path):
         lib_path = 'libbenchmark.so'
 
-lib = ctypes.CDLL(lib_path)
+# Resolve all of the library's relocations at load time (RTLD_NOW) rather
+# than on first call, so no lazy PLT binding lands in a timed iteration;
+# RTLD_DEEPBIND (glibc only) makes the library prefer its own symbols
+try:
+    lib = ctypes.CDLL(lib_path, mode=ctypes.DEFAULT_MODE | os.RTLD_NOW
+                      | getattr(os, 'RTLD_DEEPBIND', 0))
+except (OSError, AttributeError):
+    lib = ctypes.CDLL(lib_path)
+
+# Each wrapper binds its foreign function(s) as default arguments (_name=_name)
+# so a call is a local lookup rather than a `lib.name` attribute lookup.
 
 # ============================================================================
 # Define C structs
@@ -28,6 +39,14 @@ class DataPoint(ctypes.Structure):
         ("name", ctypes.c_char * 32)
     ]
 
+# NumPy view of the same layout, used to fill DataPoint arrays column-wise
+DATAPOINT_DTYPE = np.dtype([
+    ('id', np.int32),
+    ('value', np.float64),
+    ('name', 'S32')
+], align=True)
+assert DATAPOINT_DTYPE.itemsize == ctypes.sizeof(DataPoint)
+
 class Node(ctypes.Structure):
     pass
 
@@ -36,30 +55,40 @@ Node._fields_ = [
     ("next", ctypes.POINTER(Node))
 ]
 
+class IndexedList(ctypes.Structure):
+    _fields_ = [
+        ("size", ctypes.c_int),
+        ("values", ctypes.POINTER(ctypes.c_int)),
+        ("nexts", ctypes.POINTER(ctypes.c_int))
+    ]
+
 # ============================================================================
 # 1. FUNCTION CALL OVERHEAD TESTS
 # ============================================================================
 
 lib.noop.argtypes = [ctypes.c_int]
 lib.noop.restype = ctypes.c_int
+_noop = lib.noop
 
-def ct_noop(x):
+def ct_noop(x, _noop=_noop):
     """Minimal function to measure pure call overhead"""
-    return lib.noop(x)
+    return _noop(x)
 
 lib.add_numbers.argtypes = [ctypes.c_int, ctypes.c_int]
 lib.add_numbers.restype = ctypes.c_int
+_add_numbers = lib.add_numbers
 
-def ct_add_numbers(a, b):
+def ct_add_numbers(a, b, _add_numbers=_add_numbers):
     """Simple arithmetic operation"""
-    return lib.add_numbers(a, b)
+    return _add_numbers(a, b)
 
 lib.calculate_simple.argtypes = [ctypes.c_int, ctypes.c_double, ctypes.c_int, ctypes.c_double]
 lib.calculate_simple.restype = ctypes.c_double
+_calculate_simple = lib.calculate_simple
 
-def ct_calculate_simple(a, b, c, d):
+def ct_calculate_simple(a, b, c, d, _calculate_simple=_calculate_simple):
     """Multiple parameter function"""
-    return lib.calculate_simple(a, b, c, d)
+    return _calculate_simple(a, b, c, d)
 
 # ============================================================================
 # 2. COMPUTE-INTENSIVE WORKLOADS
@@ -67,31 +96,35 @@ def ct_calculate_simple(a, b, c, d):
 
 lib.fibonacci_recursive.argtypes = [ctypes.c_int]
 lib.fibonacci_recursive.restype = ctypes.c_longlong
+_fibonacci_recursive = lib.fibonacci_recursive
 
-def ct_fibonacci_recursive(n):
+def ct_fibonacci_recursive(n, _fibonacci_recursive=_fibonacci_recursive):
     """Fibonacci (recursive) - measures call stack overhead"""
-    return lib.fibonacci_recursive(n)
+    return _fibonacci_recursive(n)
 
 lib.fibonacci_iterative.argtypes = [ctypes.c_int]
 lib.fibonacci_iterative.restype = ctypes.c_longlong
+_fibonacci_iterative = lib.fibonacci_iterative
 
-def ct_fibonacci_iterative(n):
+def ct_fibonacci_iterative(n, _fibonacci_iterative=_fibonacci_iterative):
     """Fibonacci (iterative) - measures loop performance"""
-    return lib.fibonacci_iterative(n)
+    return _fibonacci_iterative(n)
 
 lib.is_prime.argtypes = [ctypes.c_longlong]
 lib.is_prime.restype = ctypes.c_int
+_is_prime = lib.is_prime
 
-def ct_is_prime(n):
+def ct_is_prime(n, _is_prime=_is_prime):
     """Prime number checking - compute intensive"""
-    return lib.is_prime(n)
+    return _is_prime(n)
 
 lib.count_primes.argtypes = [ctypes.c_int, ctypes.c_int]
 lib.count_primes.restype = ctypes.c_int
+_count_primes = lib.count_primes
 
-def ct_count_primes(start, end):
+def ct_count_primes(start, end, _count_primes=_count_primes):
     """Count primes in range"""
-    return lib.count_primes(start, end)
+    return _count_primes(start, end)
 
 lib.matrix_multiply.argtypes = [
     ndpointer(ctypes.c_double, flags="C_CONTIGUOUS"),
@@ -100,20 +133,22 @@ lib.matrix_multiply.argtypes = [
     ctypes.c_int
 ]
 lib.matrix_multiply.restype = None
+_matrix_multiply = lib.matrix_multiply
 
-def ct_matrix_multiply(A, B):
+def ct_matrix_multiply(A, B, _matrix_multiply=_matrix_multiply):
     """Matrix multiplication - compute intensive"""
     n = A.shape[0]
     C = np.zeros((n, n), dtype=np.float64)
-    lib.matrix_multiply(A, B, C, n)
+    _matrix_multiply(A, B, C, n)
     return C
 
 lib.compute_math_intensive.argtypes = [ctypes.c_double, ctypes.c_int]
 lib.compute_math_intensive.restype = ctypes.c_double
+_compute_math_intensive = lib.compute_math_intensive
 
-def ct_compute_math_intensive(x, iterations):
+def ct_compute_math_intensive(x, iterations, _compute_math_intensive=_compute_math_intensive):
     """Mathematical operations - transcendental functions"""
-    return lib.compute_math_intensive(x, iterations)
+    return _compute_math_intensive(x, iterations)
 
 # ============================================================================
 # 3. MEMORY-INTENSIVE WORKLOADS
@@ -121,17 +156,19 @@ def ct_compute_math_intensive(x, iterations):
 
 lib.sum_array.argtypes = [ndpointer(ctypes.c_double, flags="C_CONTIGUOUS"), ctypes.c_int]
 lib.sum_array.restype = ctypes.c_double
+_sum_array = lib.sum_array
 
-def ct_sum_array(arr):
+def ct_sum_array(arr, _sum_array=_sum_array):
     """Array sum - memory read intensive"""
-    return lib.sum_array(arr, len(arr))
+    return _sum_array(arr, arr.size)
 
 lib.scale_array.argtypes = [ndpointer(ctypes.c_double, flags="C_CONTIGUOUS"), ctypes.c_int, ctypes.c_double]
 lib.scale_array.restype = None
+_scale_array = lib.scale_array
 
-def ct_scale_array(arr, factor):
+def ct_scale_array(arr, factor, _scale_array=_scale_array):
     """Array operations - read and write"""
-    lib.scale_array(arr, len(arr), factor)
+    _scale_array(arr, arr.size, factor)
 
 lib.copy_array.argtypes = [
     ndpointer(ctypes.c_double, flags="C_CONTIGUOUS"),
@@ -139,12 +176,16 @@ lib.copy_array.argtypes = [
     ctypes.c_int
 ]
 lib.copy_array.restype = None
+_copy_array = lib.copy_array
 
-def ct_copy_array(src):
-    """Memory copy operation"""
-    dst = np.empty_like(src)
-    lib.copy_array(src, dst, len(src))
-    return dst
+def ct_copy_array(src, out=None, _copy_array=_copy_array):
+    """Memory copy operation; writes into out if given"""
+    if out is None:
+        out = np.empty_like(src)
+    elif out.size < src.size:
+        raise ValueError("out is smaller than src")
+    _copy_array(src, out, src.size)
+    return out
 
 lib.dot_product.argtypes = [
     ndpointer(ctypes.c_double, flags="C_CONTIGUOUS"),
@@ -152,24 +193,27 @@ lib.dot_product.argtypes = [
     ctypes.c_int
 ]
 lib.dot_product.restype = ctypes.c_double
+_dot_product = lib.dot_product
 
-def ct_dot_product(a, b):
+def ct_dot_product(a, b, _dot_product=_dot_product):
     """Array dot product"""
-    return lib.dot_product(a, b, len(a))
+    return _dot_product(a, b, a.size)
 
 lib.array_reverse.argtypes = [ndpointer(ctypes.c_double, flags="C_CONTIGUOUS"), ctypes.c_int]
 lib.array_reverse.restype = None
+_array_reverse = lib.array_reverse
 
-def ct_array_reverse(arr):
+def ct_array_reverse(arr, _array_reverse=_array_reverse):
     """Array manipulation with complex access pattern"""
-    lib.array_reverse(arr, len(arr))
+    _array_reverse(arr, arr.size)
 
 lib.sum_strided.argtypes = [ndpointer(ctypes.c_double, flags="C_CONTIGUOUS"), ctypes.c_int, ctypes.c_int]
 lib.sum_strided.restype = ctypes.c_double
+_sum_strided = lib.sum_strided
 
-def ct_sum_strided(arr, stride):
+def ct_sum_strided(arr, stride, _sum_strided=_sum_strided):
     """Strided access pattern"""
-    return lib.sum_strided(arr, len(arr), stride)
+    return _sum_strided(arr, arr.size, stride)
 
 # ============================================================================
 # 4. DATA MARSHALLING TESTS
@@ -177,47 +221,93 @@ def ct_sum_strided(arr, stride):
 
 lib.string_length.argtypes = [ctypes.c_char_p]
 lib.string_length.restype = ctypes.c_int
+_string_length = lib.string_length
 
-def ct_string_length(s):
-    """String length (measures string marshalling)"""
-    return lib.string_length(s.encode('utf-8'))
+def ct_string_length(s, _string_length=_string_length):
+    """String length (measures string marshalling); accepts str or UTF-8 bytes"""
+    return _string_length(s if isinstance(s, bytes) else s.encode('utf-8'))
 
 lib.string_concat.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
 lib.string_concat.restype = ctypes.POINTER(ctypes.c_char)
 
 lib.free_string.argtypes = [ctypes.POINTER(ctypes.c_char)]
 lib.free_string.restype = None
-
-def ct_string_concat(s1, s2):
-    """String concatenation"""
-    result_ptr = lib.string_concat(s1.encode('utf-8'), s2.encode('utf-8'))
-    result = ctypes.cast(result_ptr, ctypes.c_char_p).value.decode('utf-8')
-    lib.free_string(result_ptr)
-    return result
+_string_concat = lib.string_concat
+_free_string = lib.free_string
+
+def ct_string_concat(s1, s2, _string_concat=_string_concat, _free_string=_free_string,
+                     _string_at=ctypes.string_at):
+    """String concatenation; accepts str or UTF-8 bytes"""
+    result_ptr = _string_concat(s1 if isinstance(s1, bytes) else s1.encode('utf-8'),
+                                s2 if isinstance(s2, bytes) else s2.encode('utf-8'))
+    raw = _string_at(result_ptr)
+    _free_string(result_ptr)
+    return raw.decode('utf-8')
 
 lib.process_datapoint.argtypes = [ctypes.POINTER(DataPoint)]
 lib.process_datapoint.restype = ctypes.c_double
+_process_datapoint = lib.process_datapoint
+
+# Per-thread scratch struct, so each call does not build a new DataPoint
+_scratch = threading.local()
 
-def ct_process_datapoint(id, value, name):
+def ct_process_datapoint(id, value, name, _process_datapoint=_process_datapoint,
+                         _scratch=_scratch):
     """Process struct"""
-    dp = DataPoint()
+    try:
+        dp, dp_ref = _scratch.datapoint
+    except AttributeError:
+        dp = DataPoint()
+        dp_ref = ctypes.byref(dp)
+        _scratch.datapoint = dp, dp_ref
     dp.id = id
     dp.value = value
     dp.name = name.encode('utf-8')
-    return lib.process_datapoint(ctypes.byref(dp))
+    return _process_datapoint(dp_ref)
 
 lib.sum_datapoints.argtypes = [ctypes.POINTER(DataPoint), ctypes.c_int]
 lib.sum_datapoints.restype = ctypes.c_double
-
-def ct_sum_datapoints(points):
+_sum_datapoints = lib.sum_datapoints
+
+def _fill_datapoints(arr, points):
+    """Write (id, value, name) tuples into a DATAPOINT_DTYPE array column by column"""
+    if arr.size:
+        ids, values, names = zip(*points)
+        encoded = [name.encode('utf-8') for name in names]
+        # NumPy would silently truncate; match the DataPoint.name setter
+        size = DATAPOINT_DTYPE['name'].itemsize
+        for name in encoded:
+            if len(name) > size:
+                raise ValueError(f"bytes too long ({len(name)}, maximum length {size})")
+        arr['id'] = ids
+        arr['value'] = values
+        arr['name'] = encoded
+    return arr
+
+def make_datapoints(points):
+    """Build a DATAPOINT_DTYPE array from (id, value, name) tuples"""
+    return _fill_datapoints(np.empty(len(points), dtype=DATAPOINT_DTYPE), points)
+
+def ct_sum_datapoints(points, _sum_datapoints=_sum_datapoints):
     """Array of structs"""
     count = len(points)
     dp_array = (DataPoint * count)()
-    for i, (id, value, name) in enumerate(points):
-        dp_array[i].id = id
-        dp_array[i].value = value
-        dp_array[i].name = name.encode('utf-8')
-    return lib.sum_datapoints(dp_array, count)
+    # Fill the ctypes array through a NumPy view of the same memory rather
+    # than per-element field setters; the array itself goes to C unchanged
+    if count:
+        _fill_datapoints(np.frombuffer(dp_array, dtype=DATAPOINT_DTYPE), points)
+    return _sum_datapoints(dp_array, count)
+
+# Separate binding that takes an already-built DATAPOINT_DTYPE array
+_sum_datapoints_prepared = lib['sum_datapoints']
+_sum_datapoints_prepared.argtypes = [
+    ndpointer(DATAPOINT_DTYPE, ndim=1, flags="C_CONTIGUOUS"), ctypes.c_int
+]
+_sum_datapoints_prepared.restype = ctypes.c_double
+
+def ct_sum_datapoints_prepared(points, _sum_datapoints_prepared=_sum_datapoints_prepared):
+    """Array of structs, already laid out as DataPoint (no per-call marshalling)"""
+    return _sum_datapoints_prepared(points, points.size)
 
 # ============================================================================
 # 5. MIXED WORKLOADS
@@ -225,10 +315,11 @@ def ct_sum_datapoints(points):
 
 lib.monte_carlo_pi.argtypes = [ctypes.c_int]
 lib.monte_carlo_pi.restype = ctypes.c_double
+_monte_carlo_pi = lib.monte_carlo_pi
 
-def ct_monte_carlo_pi(iterations):
+def ct_monte_carlo_pi(iterations, _monte_carlo_pi=_monte_carlo_pi):
     """Monte Carlo calculation"""
-    return lib.monte_carlo_pi(iterations)
+    return _monte_carlo_pi(iterations)
 
 lib.blur_array.argtypes = [
     ndpointer(ctypes.c_double, flags="C_CONTIGUOUS"),
@@ -237,20 +328,22 @@ lib.blur_array.argtypes = [
     ctypes.c_int
 ]
 lib.blur_array.restype = None
+_blur_array = lib.blur_array
 
-def ct_blur_array(input_arr):
+def ct_blur_array(input_arr, _blur_array=_blur_array):
     """Image processing simulation - blur operation"""
     height, width = input_arr.shape
     output_arr = np.zeros((height, width), dtype=np.float64)
-    lib.blur_array(input_arr, output_arr, width, height)
+    _blur_array(input_arr, output_arr, width, height)
     return output_arr
 
 lib.sort_array.argtypes = [ndpointer(ctypes.c_double, flags="C_CONTIGUOUS"), ctypes.c_int]
 lib.sort_array.restype = None
+_sort_array = lib.sort_array
 
-def ct_sort_array(arr):
+def ct_sort_array(arr, _sort_array=_sort_array):
     """Sorting - quicksort implementation"""
-    lib.sort_array(arr, len(arr))
+    _sort_array(arr, arr.size)
 
 # ============================================================================
 # 6. MEMORY ALLOCATION TESTS
@@ -261,14 +354,22 @@ lib.allocate_array.restype = ctypes.POINTER(ctypes.c_double)
 
 lib.free_array.argtypes = [ctypes.POINTER(ctypes.c_double)]
 lib.free_array.restype = None
-
-def ct_allocate_and_sum(size):
+_allocate_array = lib.allocate_array
+_free_array = lib.free_array
+
+# Separate binding of sum_array taking a raw pointer, so C-allocated buffers
+# are passed straight through without wrapping them in an ndarray first
+# (lib['name'] returns a fresh function object, unlike lib.name)
+_sum_array_ptr = lib['sum_array']
+_sum_array_ptr.argtypes = [ctypes.POINTER(ctypes.c_double), ctypes.c_int]
+_sum_array_ptr.restype = ctypes.c_double
+
+def ct_allocate_and_sum(size, _allocate_array=_allocate_array, _sum_array_ptr=_sum_array_ptr,
+                        _free_array=_free_array):
     """Allocate array and compute sum"""
-    arr_ptr = lib.allocate_array(size)
-    # Create numpy array from pointer (read-only view)
-    arr = np.ctypeslib.as_array(arr_ptr, shape=(size,))
-    total = lib.sum_array(arr, size)
-    lib.free_array(arr_ptr)
+    arr_ptr = _allocate_array(size)
+    total = _sum_array_ptr(arr_ptr, size)
+    _free_array(arr_ptr)
     return total
 
 # ============================================================================
@@ -277,64 +378,194 @@ def ct_allocate_and_sum(size):
 
 lib.apply_operation.argtypes = [ctypes.c_double, ctypes.c_int]
 lib.apply_operation.restype = ctypes.c_double
+_apply_operation = lib.apply_operation
 
-def ct_apply_operation(initial, iterations):
+def ct_apply_operation(initial, iterations, _apply_operation=_apply_operation):
     """Apply operation repeatedly"""
-    return lib.apply_operation(initial, iterations)
+    return _apply_operation(initial, iterations)
 
 # ============================================================================
 # 8. BUFFER PROCESSING
 # ============================================================================
 
-lib.process_buffer.argtypes = [ndpointer(ctypes.c_ubyte, flags="C_CONTIGUOUS"), ctypes.c_int]
-lib.process_buffer.restype = None
+# From here on each function is bound once through a CFUNCTYPE prototype:
+# the signature lives in one expression and nothing touches lib afterwards
 
-def ct_process_buffer(buffer):
-    """Process byte buffer"""
-    lib.process_buffer(buffer, len(buffer))
+# process_buffer takes the buffer's first byte through from_buffer: ndpointer
+# goes through the slower array-interface path on every call. Both checks
+# below still run on every call, as the argtypes check did
+_process_buffer = ctypes.CFUNCTYPE(
+    None,
+    ctypes.POINTER(ctypes.c_ubyte),
+    ctypes.c_int
+)(("process_buffer", lib))
+_first_byte = ctypes.c_ubyte.from_buffer
 
-lib.checksum.argtypes = [ndpointer(ctypes.c_ubyte, flags="C_CONTIGUOUS"), ctypes.c_int]
-lib.checksum.restype = ctypes.c_uint
+def ct_process_buffer(buffer, _process_buffer=_process_buffer, _first_byte=_first_byte):
+    """Process byte buffer"""
+    if buffer.dtype != np.uint8 or not buffer.flags.c_contiguous:
+        raise TypeError("buffer must be a C-contiguous uint8 array")
+    if buffer.size:
+        _process_buffer(_first_byte(buffer), buffer.size)
+
+_checksum = ctypes.CFUNCTYPE(
+    ctypes.c_uint,
+    ndpointer(ctypes.c_ubyte, flags="C_CONTIGUOUS"),
+    ctypes.c_int
+)(("checksum", lib))
 
-def ct_checksum(buffer):
+def ct_checksum(buffer, _checksum=_checksum):
     """Calculate checksum"""
-    return lib.checksum(buffer, len(buffer))
+    return _checksum(buffer, buffer.size)
+
+_process_and_checksum = ctypes.CFUNCTYPE(
+    ctypes.c_uint,
+    ndpointer(ctypes.c_ubyte, flags="C_CONTIGUOUS"),
+    ctypes.c_int
+)(("process_and_checksum", lib))
+
+def ct_process_and_checksum(buffer, _process_and_checksum=_process_and_checksum):
+    """Process byte buffer and return its checksum"""
+    return _process_and_checksum(buffer, buffer.size)
+
+_sha256 = ctypes.CFUNCTYPE(
+    None,
+    ndpointer(ctypes.c_ubyte, flags="C_CONTIGUOUS"),
+    ctypes.c_int,
+    ctypes.c_char_p
+)(("sha256", lib))
+
+def ct_sha256(buffer, _sha256=_sha256):
+    """SHA-256 digest of byte buffer"""
+    out = ctypes.create_string_buffer(32)
+    _sha256(buffer, buffer.size, out)
+    return out.raw
+
+def _buffer_table(buffers):
+    """Address and size arrays for a list of C-contiguous uint8 arrays"""
+    for buffer in buffers:
+        if buffer.dtype != np.uint8 or not buffer.flags.c_contiguous:
+            raise TypeError("buffers must be C-contiguous uint8 arrays")
+    count = len(buffers)
+    ptrs = np.fromiter((buffer.ctypes.data for buffer in buffers), dtype=np.uintp, count=count)
+    sizes = np.fromiter((buffer.size for buffer in buffers), dtype=np.intc, count=count)
+    return ptrs, sizes
+
+_process_buffers = ctypes.CFUNCTYPE(
+    None,
+    ndpointer(np.uintp, flags="C_CONTIGUOUS"),
+    ndpointer(ctypes.c_int, flags="C_CONTIGUOUS"),
+    ctypes.c_int
+)(("process_buffers", lib))
+
+def ct_process_buffers(buffers, _process_buffers=_process_buffers):
+    """Process many byte buffers in one call"""
+    ptrs, sizes = _buffer_table(buffers)
+    _process_buffers(ptrs, sizes, sizes.size)
+
+_checksum_many = ctypes.CFUNCTYPE(
+    None,
+    ndpointer(np.uintp, flags="C_CONTIGUOUS"),
+    ndpointer(ctypes.c_int, flags="C_CONTIGUOUS"),
+    ctypes.c_int,
+    ndpointer(ctypes.c_uint, flags="C_CONTIGUOUS")
+)(("checksum_many", lib))
+
+def ct_checksum_many(buffers, _checksum_many=_checksum_many):
+    """Checksum many byte buffers in one call"""
+    ptrs, sizes = _buffer_table(buffers)
+    out = np.empty(sizes.size, dtype=np.uintc)
+    _checksum_many(ptrs, sizes, sizes.size, out)
+    return out
+
+_filter_buffer = ctypes.CFUNCTYPE(
+    ctypes.c_int,
+    ndpointer(ctypes.c_ubyte, flags="C_CONTIGUOUS"),
+    ctypes.c_int,
+    ctypes.c_ubyte,
+    ndpointer(ctypes.c_ubyte, flags="C_CONTIGUOUS")
+)(("filter_buffer", lib))
+
+def ct_filter_buffer(buffer, pattern, _filter_buffer=_filter_buffer):
+    """Copy of buffer with every byte equal to pattern removed"""
+    out = np.empty(buffer.size, dtype=np.uint8)
+    count = _filter_buffer(buffer, buffer.size, pattern, out)
+    return out[:count]
 
 # ============================================================================
 # 9. POINTER-INTENSIVE OPERATIONS
 # ============================================================================
 
-lib.create_list.argtypes = [ctypes.c_int]
-lib.create_list.restype = ctypes.POINTER(Node)
-
-lib.sum_list.argtypes = [ctypes.POINTER(Node)]
-lib.sum_list.restype = ctypes.c_int
+# The list handles never leave these wrappers, so they travel as plain
+# c_void_p integers: no POINTER(Node) object is built for the return value
+# or type-checked on the way back in
+_create_list = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_int)(("create_list", lib))
+_sum_list = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p)(("sum_list", lib))
+_free_list = ctypes.CFUNCTYPE(None, ctypes.c_void_p)(("free_list", lib))
 
-lib.free_list.argtypes = [ctypes.POINTER(Node)]
-lib.free_list.restype = None
-
-def ct_list_operations(size):
+def ct_list_operations(size, _create_list=_create_list, _sum_list=_sum_list, _free_list=_free_list):
     """Create, sum, and free linked list"""
-    head = lib.create_list(size)
-    total = lib.sum_list(head)
-    lib.free_list(head)
+    head = _create_list(size)
+    total = _sum_list(head)
+    _free_list(head)
+    return total
+
+_create_list_soa = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_int)(("create_list_soa", lib))
+_sum_list_soa = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p)(("sum_list_soa", lib))
+_free_list_soa = ctypes.CFUNCTYPE(None, ctypes.c_void_p)(("free_list_soa", lib))
+
+def ct_list_operations_soa(size, _create_list_soa=_create_list_soa, _sum_list_soa=_sum_list_soa,
+                           _free_list_soa=_free_list_soa):
+    """Create, sum, and free struct-of-arrays linked list"""
+    lst = _create_list_soa(size)
+    if not lst:
+        raise MemoryError()
+    total = _sum_list_soa(lst)
+    _free_list_soa(lst)
     return total
 
 # ============================================================================
 # 10. BITWISE OPERATIONS
 # ============================================================================
 
-lib.popcount.argtypes = [ctypes.c_uint]
-lib.popcount.restype = ctypes.c_int
+_popcount = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_uint)(("popcount", lib))
 
-def ct_popcount(n):
+def ct_popcount(n, _popcount=_popcount):
     """Count set bits"""
-    return lib.popcount(n)
+    return _popcount(n)
 
-lib.bitwise_reduce.argtypes = [ndpointer(ctypes.c_uint, flags="C_CONTIGUOUS"), ctypes.c_int]
-lib.bitwise_reduce.restype = ctypes.c_uint
+_bitwise_reduce = ctypes.CFUNCTYPE(
+    ctypes.c_uint,
+    ndpointer(ctypes.c_uint, flags="C_CONTIGUOUS"),
+    ctypes.c_int
+)(("bitwise_reduce", lib))
 
-def ct_bitwise_reduce(arr):
+def ct_bitwise_reduce(arr, _bitwise_reduce=_bitwise_reduce):
     """Bitwise operations on array"""
-    return lib.bitwise_reduce(arr, len(arr))
+    return _bitwise_reduce(arr, arr.size)
+
+_bitwise_reduce_many = ctypes.CFUNCTYPE(
+    None,
+    ndpointer(ctypes.c_uint, ndim=2, flags="C_CONTIGUOUS"),
+    ctypes.c_int,
+    ctypes.c_int,
+    ndpointer(ctypes.c_uint, flags="C_CONTIGUOUS")
+)(("bitwise_reduce_many", lib))
+
+def ct_bitwise_reduce_many(arr, _bitwise_reduce_many=_bitwise_reduce_many):
+    """Bitwise reduction of every row in one call"""
+    rows, cols = arr.shape
+    out = np.empty(rows, dtype=np.uintc)
+    _bitwise_reduce_many(arr, rows, cols, out)
+    return out
+
+_popcount_array = ctypes.CFUNCTYPE(
+    ctypes.c_ulonglong,
+    ndpointer(ctypes.c_uint, flags="C_CONTIGUOUS"),
+    ctypes.c_int
+)(("popcount_array", lib))
+
+def ct_popcount_array(arr, _popcount_array=_popcount_array):
+    """Total set bits over an array"""
+    return _popcount_array(arr, arr.size)
 
@@ -1,6 +1,8 @@
 # Cython header file for C library declarations
 
-cdef extern from "benchmark_lib.h":
+# Nothing in the library touches Python objects, so every function can be
+# called with the GIL released
+cdef extern from "benchmark_lib.h" nogil:
     # Function call overhead
     int noop(int x)
     int add_numbers(int a, int b)
@@ -51,6 +53,11 @@ cdef extern from "benchmark_lib.h":
     # Buffer processing
     void process_buffer(unsigned char* buffer, int size)
     unsigned int checksum(unsigned char* buffer, int size)
+    unsigned int process_and_checksum(unsigned char* buffer, int size)
+    void sha256(unsigned char* buffer, int size, unsigned char* out)
+    void process_buffers(unsigned char** buffers, int* sizes, int count)
+    void checksum_many(unsigned char** buffers, int* sizes, int count, unsigned int* out)
+    int filter_buffer(unsigned char* in_, int size, unsigned char pattern, unsigned char* out)
     
     # Pointer-intensive
     ctypedef struct Node:
@@ -61,7 +68,18 @@ cdef extern from "benchmark_lib.h":
     int sum_list(Node* head)
     void free_list(Node* head)
     
+    ctypedef struct IndexedList:
+        int size
+        int* values
+        int* nexts
+    
+    IndexedList* create_list_soa(int size)
+    int sum_list_soa(IndexedList* list)
+    void free_list_soa(IndexedList* list)
+    
     # Bitwise operations
     int popcount(unsigned int n)
     unsigned int bitwise_reduce(unsigned int* arr, int size)
+    void bitwise_reduce_many(unsigned int* arr, int rows, int cols, unsigned int* out)
+    unsigned long long popcount_array(unsigned int* arr, int size)
 
@@ -33,7 +33,10 @@ def cy_calculate_simple(int a, double b, int c, double d):
 
 def cy_fibonacci_recursive(int n):
     """Fibonacci (recursive) - measures call stack overhead"""
-    return fibonacci_recursive(n)
+    cdef long long result
+    with nogil:
+        result = fibonacci_recursive(n)
+    return result
 
 def cy_fibonacci_iterative(int n):
     """Fibonacci (iterative) - measures loop performance"""
@@ -45,7 +48,10 @@ def cy_is_prime(long long n):
 
 def cy_count_primes(int start, int end):
     """Count primes in range"""
-    return count_primes(start, end)
+    cdef int result
+    with nogil:
+        result = count_primes(start, end)
+    return result
 
 def cy_matrix_multiply(np.ndarray[double, ndim=2, mode="c"] A,
                         np.ndarray[double, ndim=2, mode="c"] B):
@@ -53,12 +59,16 @@ def cy_matrix_multiply(np.ndarray[double, ndim=2, mode="c"] A,
     cdef int n = A.shape[0]
     cdef np.ndarray[double, ndim=2, mode="c"] C = np.zeros((n, n), dtype=np.float64)
     
-    matrix_multiply(&A[0, 0], &B[0, 0], &C[0, 0], n)
+    with nogil:
+        matrix_multiply(&A[0, 0], &B[0, 0], &C[0, 0], n)
     return C
 
 def cy_compute_math_intensive(double x, int iterations):
     """Mathematical operations - transcendental functions"""
-    return compute_math_intensive(x, iterations)
+    cdef double result
+    with nogil:
+        result = compute_math_intensive(x, iterations)
+    return result
 
 # ============================================================================
 # 3. MEMORY-INTENSIVE WORKLOADS
@@ -66,44 +76,60 @@ def cy_compute_math_intensive(double x, int iterations):
 
 def cy_sum_array(np.ndarray[double, ndim=1, mode="c"] arr):
     """Array sum - memory read intensive"""
-    return sum_array(&arr[0], arr.shape[0])
+    cdef double result
+    with nogil:
+        result = sum_array(&arr[0], arr.shape[0])
+    return result
 
 def cy_scale_array(np.ndarray[double, ndim=1, mode="c"] arr, double factor):
     """Array operations - read and write"""
-    scale_array(&arr[0], arr.shape[0], factor)
-
-def cy_copy_array(np.ndarray[double, ndim=1, mode="c"] src):
-    """Memory copy operation"""
-    cdef np.ndarray[double, ndim=1, mode="c"] dst = np.empty_like(src)
-    copy_array(&src[0], &dst[0], src.shape[0])
-    return dst
+    with nogil:
+        scale_array(&arr[0], arr.shape[0], factor)
+
+def cy_copy_array(np.ndarray[double, ndim=1, mode="c"] src,
+                  np.ndarray[double, ndim=1, mode="c"] out=None):
+    """Memory copy operation; writes into out if given"""
+    if out is None:
+        out = np.empty_like(src)
+    elif out.shape[0] < src.shape[0]:
+        raise ValueError("out is smaller than src")
+    with nogil:
+        copy_array(&src[0], &out[0], src.shape[0])
+    return out
 
 def cy_dot_product(np.ndarray[double, ndim=1, mode="c"] a,
                     np.ndarray[double, ndim=1, mode="c"] b):
     """Array dot product"""
-    return dot_product(&a[0], &b[0], a.shape[0])
+    cdef double result
+    with nogil:
+        result = dot_product(&a[0], &b[0], a.shape[0])
+    return result
 
 def cy_array_reverse(np.ndarray[double, ndim=1, mode="c"] arr):
     """Array manipulation with complex access pattern"""
-    array_reverse(&arr[0], arr.shape[0])
+    with nogil:
+        array_reverse(&arr[0], arr.shape[0])
 
 def cy_sum_strided(np.ndarray[double, ndim=1, mode="c"] arr, int stride):
     """Strided access pattern"""
-    return sum_strided(&arr[0], arr.shape[0], stride)
+    cdef double result
+    with nogil:
+        result = sum_strided(&arr[0], arr.shape[0], stride)
+    return result
 
 # ============================================================================
 # 4. DATA MARSHALLING TESTS
 # ============================================================================
 
-def cy_string_length(str s):
-    """String length (measures string marshalling)"""
-    cdef bytes py_bytes = s.encode('utf-8')
+def cy_string_length(s):
+    """String length (measures string marshalling); accepts str or UTF-8 bytes"""
+    cdef bytes py_bytes = s if isinstance(s, bytes) else s.encode('utf-8')
     return string_length(py_bytes)
 
-def cy_string_concat(str s1, str s2):
-    """String concatenation"""
-    cdef bytes b1 = s1.encode('utf-8')
-    cdef bytes b2 = s2.encode('utf-8')
+def cy_string_concat(s1, s2):
+    """String concatenation; accepts str or UTF-8 bytes"""
+    cdef bytes b1 = s1 if isinstance(s1, bytes) else s1.encode('utf-8')
+    cdef bytes b2 = s2 if isinstance(s2, bytes) else s2.encode('utf-8')
     cdef char* result = string_concat(b1, b2)
     cdef str py_result = result.decode('utf-8')
     free_string(result)
@@ -135,17 +161,29 @@ def cy_sum_datapoints(list points):
         name_bytes = points[i][2].encode('utf-8')
         strcpy(dp_array[i].name, name_bytes)
     
-    cdef double result = sum_datapoints(dp_array, count)
+    cdef double result
+    with nogil:
+        result = sum_datapoints(dp_array, count)
     free(dp_array)
     return result
 
+def cy_sum_datapoints_prepared(np.ndarray[DataPoint, ndim=1, mode="c"] points):
+    """Array of structs, already laid out as DataPoint (no per-call marshalling)"""
+    cdef double result
+    with nogil:
+        result = sum_datapoints(&points[0], points.shape[0])
+    return result
+
 # ============================================================================
 # 5. MIXED WORKLOADS
 # ============================================================================
 
 def cy_monte_carlo_pi(int iterations):
     """Monte Carlo calculation"""
-    return monte_carlo_pi(iterations)
+    cdef double result
+    with nogil:
+        result = monte_carlo_pi(iterations)
+    return result
 
 def cy_blur_array(np.ndarray[double, ndim=2, mode="c"] input_arr):
     """Image processing simulation - blur operation"""
@@ -153,12 +191,14 @@ def cy_blur_array(np.ndarray[double, ndim=2, mode="c"] input_arr):
     cdef int width = input_arr.shape[1]
     cdef np.ndarray[double, ndim=2, mode="c"] output_arr = np.zeros((height, width), dtype=np.float64)
     
-    blur_array(&input_arr[0, 0], &output_arr[0, 0], width, height)
+    with nogil:
+        blur_array(&input_arr[0, 0], &output_arr[0, 0], width, height)
     return output_arr
 
 def cy_sort_array(np.ndarray[double, ndim=1, mode="c"] arr):
     """Sorting - quicksort implementation"""
-    sort_array(&arr[0], arr.shape[0])
+    with nogil:
+        sort_array(&arr[0], arr.shape[0])
 
 # ============================================================================
 # 6. MEMORY ALLOCATION TESTS
@@ -166,9 +206,12 @@ def cy_sort_array(np.ndarray[double, ndim=1, mode="c"] arr):
 
 def cy_allocate_and_sum(int size):
     """Allocate array and compute sum"""
-    cdef double* arr = allocate_array(size)
-    cdef double total = sum_array(arr, size)
-    free_array(arr)
+    cdef double* arr
+    cdef double total
+    with nogil:
+        arr = allocate_array(size)
+        total = sum_array(arr, size)
+        free_array(arr)
     return total
 
 # ============================================================================
@@ -177,7 +220,10 @@ def cy_allocate_and_sum(int size):
 
 def cy_apply_operation(double initial, int iterations):
     """Apply operation repeatedly"""
-    return apply_operation(initial, iterations)
+    cdef double result
+    with nogil:
+        result = apply_operation(initial, iterations)
+    return result
 
 # ============================================================================
 # 8. BUFFER PROCESSING
@@ -185,11 +231,74 @@ def cy_apply_operation(double initial, int iterations):
 
 def cy_process_buffer(np.ndarray[unsigned char, ndim=1, mode="c"] buffer):
     """Process byte buffer"""
-    process_buffer(&buffer[0], buffer.shape[0])
+    with nogil:
+        process_buffer(&buffer[0], buffer.shape[0])
 
 def cy_checksum(np.ndarray[unsigned char, ndim=1, mode="c"] buffer):
     """Calculate checksum"""
-    return checksum(&buffer[0], buffer.shape[0])
+    cdef unsigned int result
+    with nogil:
+        result = checksum(&buffer[0], buffer.shape[0])
+    return result
+
+def cy_process_and_checksum(np.ndarray[unsigned char, ndim=1, mode="c"] buffer):
+    """Process byte buffer and return its checksum"""
+    cdef unsigned int result
+    with nogil:
+        result = process_and_checksum(&buffer[0], buffer.shape[0])
+    return result
+
+def cy_sha256(np.ndarray[unsigned char, ndim=1, mode="c"] buffer):
+    """SHA-256 digest of byte buffer"""
+    cdef unsigned char out[32]
+    with nogil:
+        sha256(<unsigned char*>buffer.data, buffer.shape[0], out)
+    return out[:32]
+
+cdef unsigned char** _buffer_table(list buffers, int* sizes) except NULL:
+    """malloc'd pointer table for a list of uint8 arrays; sizes go into sizes"""
+    cdef int count = len(buffers)
+    cdef unsigned char** ptrs = <unsigned char**>malloc((count or 1) * sizeof(unsigned char*))
+    if ptrs == NULL:
+        raise MemoryError()
+    cdef unsigned char[::1] view
+    cdef int i
+    try:
+        for i in range(count):
+            view = buffers[i]
+            ptrs[i] = &view[0]
+            sizes[i] = view.shape[0]
+    except:
+        free(ptrs)
+        raise
+    return ptrs
+
+def cy_process_buffers(list buffers):
+    """Process many byte buffers in one call"""
+    cdef np.ndarray[int, ndim=1, mode="c"] sizes = np.empty(len(buffers), dtype=np.intc)
+    cdef unsigned char** ptrs = _buffer_table(buffers, <int*>sizes.data)
+    with nogil:
+        process_buffers(ptrs, <int*>sizes.data, sizes.shape[0])
+    free(ptrs)
+
+def cy_checksum_many(list buffers):
+    """Checksum many byte buffers in one call"""
+    cdef np.ndarray[int, ndim=1, mode="c"] sizes = np.empty(len(buffers), dtype=np.intc)
+    cdef np.ndarray[unsigned int, ndim=1, mode="c"] out = np.empty(len(buffers), dtype=np.uintc)
+    cdef unsigned char** ptrs = _buffer_table(buffers, <int*>sizes.data)
+    with nogil:
+        checksum_many(ptrs, <int*>sizes.data, sizes.shape[0], <unsigned int*>out.data)
+    free(ptrs)
+    return out
+
+def cy_filter_buffer(np.ndarray[unsigned char, ndim=1, mode="c"] buffer, unsigned char pattern):
+    """Copy of buffer with every byte equal to pattern removed"""
+    cdef np.ndarray[unsigned char, ndim=1, mode="c"] out = np.empty(buffer.shape[0], dtype=np.uint8)
+    cdef int count
+    with nogil:
+        count = filter_buffer(<unsigned char*>buffer.data, buffer.shape[0], pattern,
+                              <unsigned char*>out.data)
+    return out[:count]
 
 # ============================================================================
 # 9. POINTER-INTENSIVE OPERATIONS
@@ -197,9 +306,23 @@ def cy_checksum(np.ndarray[unsigned char, ndim=1, mode="c"] buffer):
 
 def cy_list_operations(int size):
     """Create, sum, and free linked list"""
-    cdef Node* head = create_list(size)
-    cdef int total = sum_list(head)
-    free_list(head)
+    cdef Node* head
+    cdef int total
+    with nogil:
+        head = create_list(size)
+        total = sum_list(head)
+        free_list(head)
+    return total
+
+def cy_list_operations_soa(int size):
+    """Create, sum, and free struct-of-arrays linked list"""
+    cdef IndexedList* lst = create_list_soa(size)
+    if lst == NULL:
+        raise MemoryError()
+    cdef int total
+    with nogil:
+        total = sum_list_soa(lst)
+        free_list_soa(lst)
     return total
 
 # ============================================================================
@@ -212,5 +335,22 @@ def cy_popcount(unsigned int n):
 
 def cy_bitwise_reduce(np.ndarray[unsigned int, ndim=1, mode="c"] arr):
     """Bitwise operations on array"""
-    return bitwise_reduce(&arr[0], arr.shape[0])
+    cdef unsigned int result
+    with nogil:
+        result = bitwise_reduce(&arr[0], arr.shape[0])
+    return result
+
+def cy_bitwise_reduce_many(np.ndarray[unsigned int, ndim=2, mode="c"] arr):
+    """Bitwise reduction of every row in one call"""
+    cdef np.ndarray[unsigned int, ndim=1, mode="c"] out = np.empty(arr.shape[0], dtype=np.uintc)
+    with nogil:
+        bitwise_reduce_many(<unsigned int*>arr.data, arr.shape[0], arr.shape[1], <unsigned int*>out.data)
+    return out
+
+def cy_popcount_array(np.ndarray[unsigned int, ndim=1, mode="c"] arr):
+    """Total set bits over an array"""
+    cdef unsigned long long result
+    with nogil:
+        result = popcount_array(&arr[0], arr.shape[0])
+    return result
 
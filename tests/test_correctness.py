@@ -2,7 +2,9 @@
 Unit tests to verify that Cython and ctypes wrappers produce identical results
 """
 
+import hashlib
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import sys
 import os
@@ -31,6 +33,21 @@ except ImportError:
 class TestCorrectness(unittest.TestCase):
     """Test that Cython and ctypes produce identical results"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Pool of scratch arrays shared by the tests that modify their input"""
+        cls._pool = {}
+    
+    def _scratch(self, arr, slot=0):
+        """Copy arr into a pooled array of the same dtype and shape; slot picks
+        one of several such arrays so a test can hold more than one at once"""
+        key = (arr.dtype.str, arr.shape, slot)
+        buf = self._pool.get(key)
+        if buf is None:
+            buf = self._pool[key] = np.empty_like(arr)
+        np.copyto(buf, arr)
+        return buf
+    
     def test_noop(self):
         """Test noop function"""
         for x in [0, 1, 42, -10, 1000]:
@@ -82,14 +99,16 @@ class TestCorrectness(unittest.TestCase):
     
     def test_matrix_multiply(self):
         """Test matrix multiplication"""
-        for size in [2, 5, 10]:
+        # 2, 5 and 10 have specialised kernels; the others use the general one
+        for size in [1, 2, 3, 5, 10, 17]:
             A = np.random.rand(size, size)
             B = np.random.rand(size, size)
             
-            cy_result = cy.cy_matrix_multiply(A.copy(), B.copy())
-            ct_result = ct.ct_matrix_multiply(A.copy(), B.copy())
+            cy_result = cy.cy_matrix_multiply(A, B)
+            ct_result = ct.ct_matrix_multiply(A, B)
             
             np.testing.assert_array_almost_equal(cy_result, ct_result)
+            np.testing.assert_array_almost_equal(cy_result, A @ B)
     
     def test_compute_math_intensive(self):
         """Test math intensive computation"""
@@ -101,19 +120,21 @@ class TestCorrectness(unittest.TestCase):
     
     def test_sum_array(self):
         """Test array sum"""
-        for size in [10, 100, 1000]:
+        # Sizes around the 4-wide vector and 16-element unrolled step
+        for size in [1, 3, 4, 10, 15, 16, 17, 100, 1000]:
             arr = np.random.rand(size)
-            cy_result = cy.cy_sum_array(arr.copy())
-            ct_result = ct.ct_sum_array(arr.copy())
+            cy_result = cy.cy_sum_array(arr)
+            ct_result = ct.ct_sum_array(arr)
             self.assertAlmostEqual(cy_result, ct_result, places=10)
+            self.assertAlmostEqual(cy_result, arr.sum(), places=10)
     
     def test_scale_array(self):
         """Test array scaling"""
         arr = np.random.rand(100)
         factor = 2.5
         
-        cy_arr = arr.copy()
-        ct_arr = arr.copy()
+        cy_arr = self._scratch(arr, 0)
+        ct_arr = self._scratch(arr, 1)
         
         cy.cy_scale_array(cy_arr, factor)
         ct.ct_scale_array(ct_arr, factor)
@@ -124,43 +145,56 @@ class TestCorrectness(unittest.TestCase):
         """Test array copy"""
         arr = np.random.rand(100)
         
-        cy_result = cy.cy_copy_array(arr.copy())
-        ct_result = ct.ct_copy_array(arr.copy())
+        cy_result = cy.cy_copy_array(arr)
+        ct_result = ct.ct_copy_array(arr)
         
         np.testing.assert_array_almost_equal(cy_result, ct_result)
         np.testing.assert_array_almost_equal(cy_result, arr)
+        
+        # Reused output buffers
+        cy_out = np.empty(100)
+        ct_out = np.empty(100)
+        for _ in range(3):
+            arr = np.random.rand(100)
+            self.assertIs(cy.cy_copy_array(arr, cy_out), cy_out)
+            self.assertIs(ct.ct_copy_array(arr, ct_out), ct_out)
+            np.testing.assert_array_equal(cy_out, arr)
+            np.testing.assert_array_equal(ct_out, arr)
+        with self.assertRaises(ValueError):
+            cy.cy_copy_array(arr, np.empty(10))
+        with self.assertRaises(ValueError):
+            ct.ct_copy_array(arr, np.empty(10))
     
     def test_dot_product(self):
         """Test dot product"""
-        for size in [10, 100, 1000]:
+        for size in [1, 3, 4, 10, 15, 16, 17, 100, 1000]:
             a = np.random.rand(size)
             b = np.random.rand(size)
             
-            cy_result = cy.cy_dot_product(a.copy(), b.copy())
-            ct_result = ct.ct_dot_product(a.copy(), b.copy())
+            cy_result = cy.cy_dot_product(a, b)
+            ct_result = ct.ct_dot_product(a, b)
             
             self.assertAlmostEqual(cy_result, ct_result, places=10)
+            self.assertAlmostEqual(cy_result, np.dot(a, b), places=10)
     
     def test_array_reverse(self):
         """Test array reversal"""
         arr = np.random.rand(100)
-        original = arr.copy()
-        
-        cy_arr = arr.copy()
-        ct_arr = arr.copy()
+        cy_arr = self._scratch(arr, 0)
+        ct_arr = self._scratch(arr, 1)
         
         cy.cy_array_reverse(cy_arr)
         ct.ct_array_reverse(ct_arr)
         
         np.testing.assert_array_almost_equal(cy_arr, ct_arr)
-        np.testing.assert_array_almost_equal(cy_arr, original[::-1])
+        np.testing.assert_array_almost_equal(cy_arr, arr[::-1])
     
     def test_sum_strided(self):
         """Test strided sum"""
         arr = np.random.rand(100)
         for stride in [1, 2, 5, 10]:
-            cy_result = cy.cy_sum_strided(arr.copy(), stride)
-            ct_result = ct.ct_sum_strided(arr.copy(), stride)
+            cy_result = cy.cy_sum_strided(arr, stride)
+            ct_result = ct.ct_sum_strided(arr, stride)
             self.assertAlmostEqual(cy_result, ct_result, places=10)
     
     def test_string_length(self):
@@ -171,6 +205,8 @@ class TestCorrectness(unittest.TestCase):
             ct_result = ct.ct_string_length(s)
             self.assertEqual(cy_result, ct_result)
             self.assertEqual(cy_result, len(s))
+            self.assertEqual(cy.cy_string_length(s.encode('utf-8')), cy_result)
+            self.assertEqual(ct.ct_string_length(s.encode('utf-8')), ct_result)
     
     def test_string_concat(self):
         """Test string concatenation"""
@@ -180,6 +216,9 @@ class TestCorrectness(unittest.TestCase):
             ct_result = ct.ct_string_concat(s1, s2)
             self.assertEqual(cy_result, ct_result)
             self.assertEqual(cy_result, s1 + s2)
+            b1, b2 = s1.encode('utf-8'), s2.encode('utf-8')
+            self.assertEqual(cy.cy_string_concat(b1, b2), cy_result)
+            self.assertEqual(ct.ct_string_concat(b1, b2), ct_result)
     
     def test_process_datapoint(self):
         """Test datapoint processing"""
@@ -196,6 +235,21 @@ class TestCorrectness(unittest.TestCase):
         cy_result = cy.cy_sum_datapoints(points)
         ct_result = ct.ct_sum_datapoints(points)
         self.assertAlmostEqual(cy_result, ct_result, places=10)
+        # Names must fit DataPoint.name; they are rejected, not truncated
+        self.assertAlmostEqual(ct.ct_sum_datapoints([(1, 2.0, "x" * 32)]), 2.0, places=10)
+        with self.assertRaises(ValueError):
+            ct.ct_sum_datapoints([(1, 2.0, "x" * 33)])
+        with self.assertRaises(ValueError):
+            ct.make_datapoints([(1, 2.0, "é" * 17)])
+
+    def test_sum_datapoints_prepared(self):
+        """Test sum of a prebuilt datapoint array"""
+        points = [(i, float(i), f"point_{i}") for i in range(10)]
+        prepared = ct.make_datapoints(points)
+        cy_result = cy.cy_sum_datapoints_prepared(prepared)
+        ct_result = ct.ct_sum_datapoints_prepared(prepared)
+        self.assertAlmostEqual(cy_result, ct_result, places=10)
+        self.assertAlmostEqual(cy_result, ct.ct_sum_datapoints(points), places=10)
     
     def test_monte_carlo_pi(self):
         """Test Monte Carlo pi estimation"""
@@ -211,16 +265,16 @@ class TestCorrectness(unittest.TestCase):
     def test_blur_array(self):
         """Test blur operation"""
         img = np.random.rand(10, 10)
-        cy_result = cy.cy_blur_array(img.copy())
-        ct_result = ct.ct_blur_array(img.copy())
+        cy_result = cy.cy_blur_array(img)
+        ct_result = ct.ct_blur_array(img)
         np.testing.assert_array_almost_equal(cy_result, ct_result)
     
     def test_sort_array(self):
         """Test array sorting"""
         arr = np.random.rand(100)
         
-        cy_arr = arr.copy()
-        ct_arr = arr.copy()
+        cy_arr = self._scratch(arr, 0)
+        ct_arr = self._scratch(arr, 1)
         
         cy.cy_sort_array(cy_arr)
         ct.ct_sort_array(ct_arr)
@@ -247,20 +301,135 @@ class TestCorrectness(unittest.TestCase):
         """Test buffer processing"""
         buffer = np.random.randint(0, 256, 100, dtype=np.uint8)
         
-        cy_buffer = buffer.copy()
-        ct_buffer = buffer.copy()
+        cy_buffer = self._scratch(buffer, 0)
+        ct_buffer = self._scratch(buffer, 1)
         
         cy.cy_process_buffer(cy_buffer)
         ct.ct_process_buffer(ct_buffer)
         
         np.testing.assert_array_equal(cy_buffer, ct_buffer)
+        
+        # Repeated calls on the same buffer, then a different one
+        cy.cy_process_buffer(cy_buffer)
+        ct.ct_process_buffer(ct_buffer)
+        np.testing.assert_array_equal(cy_buffer, ct_buffer)
+        np.testing.assert_array_equal(ct_buffer, (buffer.astype(np.int64) + 26) % 256)
+        other = self._scratch(buffer, 2)
+        ct.ct_process_buffer(other)
+        np.testing.assert_array_equal(other, (buffer.astype(np.int64) + 13) % 256)
+        
+        # Non-contiguous views are rejected rather than walked past their end
+        with self.assertRaises((TypeError, ValueError)):
+            cy.cy_process_buffer(buffer[::-1])
+        with self.assertRaises((TypeError, ValueError)):
+            ct.ct_process_buffer(buffer[::-1])
+        
+        # A buffer already passed in is checked again on the next call
+        retyped = np.zeros(8, dtype=np.uint8)
+        ct.ct_process_buffer(retyped)
+        retyped.dtype = np.uint16
+        with self.assertRaises(TypeError):
+            ct.ct_process_buffer(retyped)
+        
+        # Sizes around the 32-byte vector width
+        for size in [1, 31, 32, 33, 1000]:
+            buffer = np.random.randint(0, 256, size, dtype=np.uint8)
+            cy_buffer = self._scratch(buffer, 0)
+            ct_buffer = self._scratch(buffer, 1)
+            cy.cy_process_buffer(cy_buffer)
+            ct.ct_process_buffer(ct_buffer)
+            np.testing.assert_array_equal(cy_buffer, (buffer.astype(np.int64) + 13) % 256)
+            np.testing.assert_array_equal(ct_buffer, cy_buffer)
+        
+        # Large enough to be split across OpenMP threads
+        buffer = np.random.randint(0, 256, (1 << 21) + 5, dtype=np.uint8)
+        cy_buffer = self._scratch(buffer, 0)
+        ct_buffer = self._scratch(buffer, 1)
+        cy.cy_process_buffer(cy_buffer)
+        ct.ct_process_buffer(ct_buffer)
+        np.testing.assert_array_equal(cy_buffer, (buffer.astype(np.int64) + 13) % 256)
+        np.testing.assert_array_equal(ct_buffer, cy_buffer)
     
     def test_checksum(self):
         """Test checksum calculation"""
         buffer = np.random.randint(0, 256, 100, dtype=np.uint8)
-        cy_result = cy.cy_checksum(buffer.copy())
-        ct_result = ct.ct_checksum(buffer.copy())
+        cy_result = cy.cy_checksum(buffer)
+        ct_result = ct.ct_checksum(buffer)
         self.assertEqual(cy_result, ct_result)
+        # Sizes around the 16/32-byte vector widths, checked in one batched call
+        buffers = [np.random.randint(0, 256, size, dtype=np.uint8)
+                   for size in [1, 15, 16, 17, 31, 32, 33, 1000]]
+        expected = [int(b.sum(dtype=np.uint64)) for b in buffers]
+        np.testing.assert_array_equal(cy.cy_checksum_many(buffers), expected)
+        np.testing.assert_array_equal(ct.ct_checksum_many(buffers), expected)
+        # A sum that wraps 2^32
+        buffer = np.full(20_000_000, 255, dtype=np.uint8)
+        expected = int(buffer.sum(dtype=np.uint64)) % 2**32
+        self.assertEqual(cy.cy_checksum(buffer), expected)
+        self.assertEqual(ct.ct_checksum(buffer), expected)
+    
+    def test_process_and_checksum(self):
+        """Test fused buffer processing and checksum"""
+        for size in [1, 15, 16, 17, 31, 32, 33, 1000]:
+            buffer = np.random.randint(0, 256, size, dtype=np.uint8)
+            expected = self._scratch(buffer, 2)
+            ct.ct_process_buffer(expected)
+            cy_buffer = self._scratch(buffer, 0)
+            ct_buffer = self._scratch(buffer, 1)
+            cy_result = cy.cy_process_and_checksum(cy_buffer)
+            ct_result = ct.ct_process_and_checksum(ct_buffer)
+            self.assertEqual(cy_result, ct_result)
+            self.assertEqual(cy_result, ct.ct_checksum(expected))
+            np.testing.assert_array_equal(cy_buffer, expected)
+            np.testing.assert_array_equal(ct_buffer, expected)
+    
+    def test_sha256(self):
+        """Test SHA-256 digest"""
+        # Sizes around the 55/56-byte padding boundary and whole blocks
+        for size in [0, 1, 55, 56, 63, 64, 65, 119, 120, 1000, 100000]:
+            buffer = np.random.randint(0, 256, size, dtype=np.uint8)
+            expected = hashlib.sha256(buffer.tobytes()).digest()
+            self.assertEqual(cy.cy_sha256(buffer), expected)
+            self.assertEqual(ct.ct_sha256(buffer), expected)
+    
+    def test_process_buffers(self):
+        """Test batched buffer processing"""
+        buffers = [np.random.randint(0, 256, n, dtype=np.uint8) for n in [0, 1, 31, 100]]
+        cy_buffers = [b.copy() for b in buffers]
+        ct_buffers = [b.copy() for b in buffers]
+        
+        cy.cy_process_buffers(cy_buffers)
+        ct.ct_process_buffers(ct_buffers)
+        
+        for b, cy_buffer, ct_buffer in zip(buffers, cy_buffers, ct_buffers):
+            expected = self._scratch(b, 2)
+            ct.ct_process_buffer(expected)
+            np.testing.assert_array_equal(cy_buffer, ct_buffer)
+            np.testing.assert_array_equal(cy_buffer, expected)
+    
+    def test_checksum_many(self):
+        """Test batched checksum calculation"""
+        buffers = [np.random.randint(0, 256, n, dtype=np.uint8) for n in [0, 1, 31, 100]]
+        cy_result = cy.cy_checksum_many(buffers)
+        ct_result = ct.ct_checksum_many(buffers)
+        np.testing.assert_array_equal(cy_result, ct_result)
+        np.testing.assert_array_equal(cy_result, [ct.ct_checksum(b) for b in buffers])
+    
+    def test_filter_buffer(self):
+        """Test byte filtering"""
+        # Sizes around the 8-byte and 64-byte steps; few distinct values so
+        # the pattern shows up often
+        for size in [0, 1, 7, 8, 9, 63, 64, 65, 1000]:
+            buffer = np.random.randint(0, 4, size, dtype=np.uint8)
+            expected = buffer[buffer != 2]
+            cy_result = cy.cy_filter_buffer(buffer, 2)
+            ct_result = ct.ct_filter_buffer(buffer, 2)
+            np.testing.assert_array_equal(cy_result, expected)
+            np.testing.assert_array_equal(ct_result, expected)
+        buffer = np.full(100, 7, dtype=np.uint8)
+        self.assertEqual(cy.cy_filter_buffer(buffer, 7).size, 0)
+        self.assertEqual(ct.ct_filter_buffer(buffer, 7).size, 0)
+        np.testing.assert_array_equal(ct.ct_filter_buffer(buffer, 0), buffer)
     
     def test_list_operations(self):
         """Test linked list operations"""
@@ -272,6 +441,14 @@ class TestCorrectness(unittest.TestCase):
             expected = sum(range(size))
             self.assertEqual(cy_result, expected)
     
+    def test_list_operations_soa(self):
+        """Test struct-of-arrays linked list operations"""
+        for size in [0, 1, 7, 8, 9, 100, 1000]:
+            cy_result = cy.cy_list_operations_soa(size)
+            ct_result = ct.ct_list_operations_soa(size)
+            self.assertEqual(cy_result, ct_result)
+            self.assertEqual(cy_result, sum(range(size)))
+    
     def test_popcount(self):
         """Test popcount"""
         test_cases = [0, 1, 0xFF, 0xFFFF, 0xFFFFFFFF]
@@ -279,13 +456,49 @@ class TestCorrectness(unittest.TestCase):
             cy_result = cy.cy_popcount(n)
             ct_result = ct.ct_popcount(n)
             self.assertEqual(cy_result, ct_result)
+            self.assertEqual(cy_result, bin(n).count('1'))
     
     def test_bitwise_reduce(self):
         """Test bitwise reduction"""
         arr = np.random.randint(0, 2**32, 100, dtype=np.uint32)
-        cy_result = cy.cy_bitwise_reduce(arr.copy())
-        ct_result = ct.ct_bitwise_reduce(arr.copy())
+        cy_result = cy.cy_bitwise_reduce(arr)
+        ct_result = ct.ct_bitwise_reduce(arr)
         self.assertEqual(cy_result, ct_result)
+        # Sizes around the 8-lane vector width, 100 arrays per size in one call
+        for size in [1, 7, 8, 9, 15, 16, 17, 1001]:
+            arr = np.random.randint(0, 2**32, (100, size), dtype=np.uint32)
+            cy_result = cy.cy_bitwise_reduce_many(arr)
+            ct_result = ct.ct_bitwise_reduce_many(arr)
+            np.testing.assert_array_equal(cy_result, ct_result)
+            np.testing.assert_array_equal(cy_result, np.bitwise_xor.reduce(arr, axis=1))
+        # Large enough to be split across OpenMP threads
+        arr = np.random.randint(0, 2**32, (1 << 20) + 3, dtype=np.uint32)
+        expected = int(np.bitwise_xor.reduce(arr))
+        self.assertEqual(cy.cy_bitwise_reduce(arr), expected)
+        self.assertEqual(ct.ct_bitwise_reduce(arr), expected)
+    
+    def test_popcount_array(self):
+        """Test array popcount"""
+        for size in [0, 1, 7, 8, 9, 15, 16, 17, 1001]:
+            arr = np.random.randint(0, 2**32, size, dtype=np.uint32)
+            cy_result = cy.cy_popcount_array(arr)
+            ct_result = ct.ct_popcount_array(arr)
+            self.assertEqual(cy_result, ct_result)
+            self.assertEqual(cy_result, int(np.unpackbits(arr.view(np.uint8)).sum()))
+        arr = np.full(100, 0xFFFFFFFF, dtype=np.uint32)
+        self.assertEqual(cy.cy_popcount_array(arr), 3200)
+        self.assertEqual(ct.ct_popcount_array(arr), 3200)
+    
+    def test_threaded_calls(self):
+        """Test calls made from several threads at once (GIL released in C)"""
+        buffers = [np.random.randint(0, 256, 100000, dtype=np.uint8) for _ in range(8)]
+        expected = [int(b.sum(dtype=np.uint64)) for b in buffers]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            self.assertEqual(list(pool.map(cy.cy_checksum, buffers)), expected)
+            self.assertEqual(list(pool.map(ct.ct_checksum, buffers)), expected)
+            sizes = [1000] * 8
+            self.assertEqual(list(pool.map(cy.cy_list_operations, sizes)),
+                             list(pool.map(ct.ct_list_operations, sizes)))
 
 
 if __name__ == '__main__':